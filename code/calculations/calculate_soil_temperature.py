@@ -14,12 +14,37 @@ Where: T_s = T_s0 + delta_T
 
 import os
 import sys
+import array
 import json
 import csv
 import datetime
+import functools
+import itertools
 import math
+import operator
 import uuid
 
+# Try to import numpy for vectorized calculations
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Try to import orjson for faster JSON parsing
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Try to import numba to compile the soil temperature recurrence
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # Try to import project modules
 try:
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,41 +58,152 @@ except ImportError:
     TimeSeries = None
 
 
+def _format_timestamps(timestamps):
+    """
+    Return the ISO 8601 strings written to CSV for a timestamp column.
+    
+    A regular series of naive whole-second datetimes is rebuilt as a numpy
+    datetime64 range and formatted in one call; anything else is formatted
+    value by value.
+    """
+    start = timestamps[0] if timestamps else None
+    if (HAS_NUMPY and len(timestamps) > 1 and isinstance(start, datetime.datetime)
+            and start.tzinfo is None and not start.microsecond):
+        try:
+            step = timestamps[1] - start
+            regular = (step > datetime.timedelta(0) and not step.microseconds and all(
+                later - earlier == step
+                for earlier, later in zip(timestamps, itertools.islice(timestamps, 1, None))
+            ))
+        except TypeError:
+            regular = False
+        if regular:
+            step64 = np.timedelta64(step, 's')
+            start64 = np.datetime64(start, 's')
+            return np.datetime_as_string(
+                np.arange(start64, start64 + len(timestamps) * step64, step64), unit='s'
+            ).tolist()
+    
+    return [
+        value.isoformat() if isinstance(value, datetime.datetime) else value
+        for value in timestamps
+    ]
+
+
+def _pack_column(values):
+    """Return values as an array('d') buffer if they are all floats, otherwise unchanged."""
+    if all(type(value) is float for value in values):
+        return array.array('d', values)
+    return values
+
+
 class SimplifiedTimeSeries:
-    """Simplified TimeSeries class for fallback use."""
+    """
+    Simplified TimeSeries class for fallback use.
+    
+    Values are stored column by column so appending a row never has to build
+    and search a full row list. Columns holding only floats are packed into
+    array('d') buffers; a column falls back to a plain list as soon as it has
+    to hold anything else (None, strings, ints).
+    
+    The row-oriented ``data`` used elsewhere in the project is a read-only
+    view: a tuple of (timestamp, location, value, ...) tuples, built once and
+    reused until the series changes. Writes go through add_data,
+    extend_column or by assigning a new list of rows to ``data``.
+    """
     
     def __init__(self, name=None):
-        self.data = []
+        self._timestamps = []
+        self._locations = []
+        self._cols = {}
+        self._rows = None
+        self._rows_key = None
         self.uuid = str(uuid.uuid4())
         self.columns = [self.uuid, "location"]
         self.metadata = {}
         self.metadata["uuid"] = self.uuid
         self.name = name
     
+    @property
+    def data(self):
+        """Read-only tuple of (timestamp, location, value, ...) rows in column order."""
+        rows_key = (len(self._timestamps), tuple(self.columns))
+        if self._rows is None or self._rows_key != rows_key:
+            n_rows = len(self._timestamps)
+            value_columns = [self._cols.get(col_name, [None] * n_rows) for col_name in self.columns[2:]]
+            self._rows = tuple(zip(self._timestamps, self._locations, *value_columns))
+            self._rows_key = rows_key
+        return self._rows
+    
+    @data.setter
+    def data(self, rows):
+        self._timestamps = [row[0] for row in rows]
+        self._locations = [row[1] for row in rows]
+        self._cols = {
+            col_name: _pack_column([row[i] if i < len(row) else None for row in rows])
+            for i, col_name in enumerate(self.columns[2:], 2)
+        }
+        self._rows = None
+    
+    def _list_column(self, col_name):
+        """Return col_name's storage as a list, unpacking an array('d') buffer if needed."""
+        column = self._cols[col_name]
+        if isinstance(column, array.array):
+            column = self._cols[col_name] = column.tolist()
+        return column
+    
     def add_column(self, column_name):
         if column_name not in self.columns:
             self.columns.append(column_name)
-            for row in self.data:
-                if len(row) < len(self.columns):
-                    row.extend([None] * (len(self.columns) - len(row)))
+            if self._timestamps:
+                self._cols[column_name] = [None] * len(self._timestamps)
+            else:
+                self._cols[column_name] = array.array('d')
     
     def add_data(self, timestamp, location, values):
         if isinstance(values, dict):
             for col_name in values.keys():
                 if col_name not in self.columns:
                     self.add_column(col_name)
-            
-            new_row = [None] * len(self.columns)
-            new_row[0] = timestamp
-            new_row[1] = location
-            
-            for col_name, value in values.items():
-                col_index = self.columns.index(col_name)
-                new_row[col_index] = value
+            row_values = [values.get(col_name) for col_name in self.columns[2:]]
         else:
-            new_row = [timestamp, location] + list(values)
+            row_values = list(values)
+            # Values beyond the known columns get generated value<n> columns, as in
+            # TimeSeries, skipping any name that is already taken
+            suffix = len(self.columns) - 2
+            while len(self.columns) - 2 < len(row_values):
+                suffix += 1
+                self.add_column(f"value{suffix}")
+            row_values.extend([None] * (len(self.columns) - 2 - len(row_values)))
         
-        self.data.append(new_row)
+        for col_name, value in zip(self.columns[2:], row_values):
+            if col_name not in self._cols:
+                self._cols[col_name] = [None] * len(self._timestamps)
+            if type(value) is float:
+                self._cols[col_name].append(value)
+            else:
+                self._list_column(col_name).append(value)
+        
+        self._timestamps.append(timestamp)
+        self._locations.append(location)
+        self._rows = None
+    
+    def extend_column(self, column_name, timestamps, locations, values):
+        """Append one row per value, setting only column_name."""
+        self.add_column(column_name)
+        n_new = len(timestamps)
+        values = list(values)
+        for col_name, column in list(self._cols.items()):
+            if col_name != column_name:
+                self._list_column(col_name).extend([None] * n_new)
+            elif isinstance(column, array.array) and all(type(value) is float for value in values):
+                column.fromlist(values)
+            else:
+                self._list_column(col_name).extend(values)
+        
+        self._timestamps.extend(timestamps)
+        self._locations.extend(locations)
+        self._rows = None
     
     def add_metadata(self, key, value):
         self.metadata[key] = value
@@ -84,18 +220,17 @@ class SimplifiedTimeSeries:
             csv_filename = f"{base_name}.csv"
             json_filename = f"{base_name}.json"
         
+        # Format the timestamp column once, then stream the stored columns
+        # straight to the CSV writer without materialising row lists
+        timestamps = _format_timestamps(self._timestamps)
+        n_rows = len(timestamps)
+        value_columns = [self._cols.get(col_name, [None] * n_rows) for col_name in self.columns[2:]]
+        
         # Save data to CSV
-        with open(csv_filename, 'w', newline='') as csvfile:
+        with open(csv_filename, 'w', newline='', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(self.columns)
-            for row in self.data:
-                formatted_row = []
-                for i, value in enumerate(row):
-                    if i == 0 and isinstance(value, datetime.datetime):
-                        formatted_row.append(value.isoformat())
-                    else:
-                        formatted_row.append(value)
-                writer.writerow(formatted_row)
+            writer.writerows(zip(timestamps, self._locations, *value_columns))
         
         # Save metadata to JSON
         with open(json_filename, 'w') as jsonfile:
@@ -104,40 +239,82 @@ class SimplifiedTimeSeries:
         return csv_filename, json_filename
 
 
-def simulate_soil_temperature_for_bucket(
-    input_timeseries,
-    bucket_params,
-    landcover_params,
-    timestep_seconds=86400,
-    temp_column="air_temperature",
-    snow_column="snowpack_depth"
-):
-    """
-    Simulate soil temperature time series for a single bucket.
-    
-    Parameters:
-    input_timeseries: TimeSeries object with air temperature and snow depth data
-    bucket_params: Dict with bucket-specific parameters
-    landcover_params: Dict with landcover-specific soil temperature parameters  
-    timestep_seconds: Timestep scaling factor
-    temp_column: Name of temperature column
-    snow_column: Name of snow depth column
-    
-    Returns:
-    TimeSeries object with soil temperature values
-    """
-    
-    # Extract landcover parameters
+if HAS_NUMBA:
+    @functools.lru_cache(maxsize=None)
+    def _make_soil_temp_kernel(K_t, C_s, f_s, D):
+        """
+        Compile the soil temperature recurrence for one set of landcover constants.
+        
+        K_t, C_s, f_s and D are shared by every bucket in a landcover, so they are
+        captured as compile-time constants and only per-bucket values are passed in.
+        """
+        @njit(cache=True)
+        def kernel(T_arr, z_arr, T0_vec, Zs_vec, rp_vec, Ts_out):
+            time_scale = D / 86400.0
+            for b in range(T0_vec.size):
+                Z_s = Zs_vec[b]
+                conduction = K_t / (1.0e+06 * C_s * (Z_s**2))
+                T_s = T0_vec[b]
+                if rp_vec[b]:
+                    # Same left-to-right order as delta_T = (D / 86400) * S * K * (T - T_s0)
+                    for i in range(T_arr.size):
+                        T_s += time_scale * math.exp(f_s * z_arr[i]) * conduction * (T_arr[i] - T_s)
+                        Ts_out[b, i] = T_s
+                else:
+                    # (D / 86400) * 1.0 is exact, so the constant factors can be combined
+                    k = time_scale * conduction
+                    for i in range(T_arr.size):
+                        T_s += k * (T_arr[i] - T_s)
+                        Ts_out[b, i] = T_s
+        
+        return kernel
+
+
+def _landcover_soil_parameters(landcover_params):
+    """Return (K_t, C_s, f_s) from landcover soil temperature parameters."""
     K_t = landcover_params.get("thermalConductivity", 0.63)
     C_s = landcover_params.get("specificHeatFreezeThaw", 1.3)
     f_s = landcover_params.get("snowDepthFactor", -3.3)
-    
-    # Extract bucket parameters
+    return K_t, C_s, f_s
+
+
+def _bucket_soil_parameters(bucket_params):
+    """Return (T_0, Z_s, receives_precipitation) from bucket parameters."""
     soil_temp_params = bucket_params.get("soilTemperature", {})
     T_0 = soil_temp_params.get("curentTemperature", 5.0)  # Note: JSON has typo "curent"
     Z_s = soil_temp_params.get("effectiveDepth", 0.5)
     receives_precipitation = bucket_params.get("receivesPrecipitation", True)
-    bucket_name = bucket_params.get("name", "Unknown")
+    return T_0, Z_s, receives_precipitation
+
+
+def _landcover_base_metadata(input_timeseries, landcover_params, timestep_seconds):
+    """
+    Build the soil temperature metadata shared by every bucket of a landcover.
+    
+    Bucket-specific keys are included as placeholders so they keep their
+    position in the output when each bucket fills them in.
+    """
+    K_t, C_s, f_s = _landcover_soil_parameters(landcover_params)
+    return {
+        **input_timeseries.metadata,
+        "calculation_method": "Thermal conductivity model with snow insulation",
+        "bucket_name": None,
+        "bucket_abbreviation": None,
+        "initial_temperature": None,
+        "thermal_conductivity": str(K_t),
+        "specific_heat_capacity": str(C_s),
+        "snow_depth_factor": str(f_s),
+        "effective_depth": None,
+        "receives_precipitation": None,
+        "timestep_seconds": str(timestep_seconds),
+        "generation_time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "formula": "delta_T = (D/86400) * S * (K_t/(1e6*C_s*Z_s^2)) * (T-T_s0)",
+    }
+
+
+def _create_bucket_timeseries(base_metadata, bucket_params):
+    """Create the output TimeSeries for a bucket, with soil temperature metadata and column."""
+    T_0, Z_s, receives_precipitation = _bucket_soil_parameters(bucket_params)
     
     # Use TimeSeries class if available, otherwise use simplified version
     TSClass = TimeSeries if TimeSeries is not None else SimplifiedTimeSeries
@@ -145,77 +322,181 @@ def simulate_soil_temperature_for_bucket(
     # Create output TimeSeries
     output_ts = TSClass()
     
-    # Copy metadata from input time series
-    for key, value in input_timeseries.metadata.items():
-        output_ts.add_metadata(key, value)
-    
-    # Add soil temperature specific metadata
-    output_ts.add_metadata("calculation_method", "Thermal conductivity model with snow insulation")
-    output_ts.add_metadata("bucket_name", bucket_name)
+    # Copy the input and landcover metadata in one step, then fill in this bucket
+    output_ts.metadata.update(base_metadata)
+    output_ts.add_metadata("bucket_name", bucket_params.get("name", "Unknown"))
     output_ts.add_metadata("bucket_abbreviation", bucket_params.get("abbreviation", ""))
     output_ts.add_metadata("initial_temperature", str(T_0))
-    output_ts.add_metadata("thermal_conductivity", str(K_t))
-    output_ts.add_metadata("specific_heat_capacity", str(C_s))
-    output_ts.add_metadata("snow_depth_factor", str(f_s))
     output_ts.add_metadata("effective_depth", str(Z_s))
     output_ts.add_metadata("receives_precipitation", str(receives_precipitation))
-    output_ts.add_metadata("timestep_seconds", str(timestep_seconds))
-    output_ts.add_metadata("generation_time", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    output_ts.add_metadata("formula", "delta_T = (D/86400) * S * (K_t/(1e6*C_s*Z_s^2)) * (T-T_s0)")
     
     # Add soil temperature column
     output_ts.add_column("soil_temperature_c")
     
-    # Find column indices
+    return output_ts
+
+
+def _find_input_columns(input_timeseries, temp_column, snow_column):
+    """Return the (temperature, snow depth) column indices of the input time series."""
     try:
         if hasattr(input_timeseries, 'columns'):
             temp_idx = input_timeseries.columns.index(temp_column)
             snow_idx = input_timeseries.columns.index(snow_column)
-            timestamp_idx = 0  # First column is always timestamp
-            location_idx = 1   # Second column is always location
         else:
             temp_idx = 2  # Assume third column for simplified case
             snow_idx = 3  # Assume fourth column for simplified case
-            timestamp_idx = 0
-            location_idx = 1
     except (ValueError, AttributeError) as e:
         raise ValueError(f"Required column not found: {e}")
     
-    # Initialize soil temperature
+    return temp_idx, snow_idx
+
+
+def _extract_input_columns(input_timeseries, temp_idx, snow_idx):
+    """
+    Read timestamps, locations, air temperature and snow depth from the input
+    in a single pass, treating missing temperature or snow values as 0.0.
+    """
+    data = input_timeseries.data
+    timestamps = [row[0] for row in data]
+    locations = [row[1] for row in data]
+    
+    # Rows normally all carry every column, so check the shortest row once
+    # and index directly instead of testing each row's length
+    if not data or min(map(len, data)) > max(temp_idx, snow_idx):
+        T_values = [0.0 if T is None else T for T in map(operator.itemgetter(temp_idx), data)]
+        z_values = [0.0 if z is None else z for z in map(operator.itemgetter(snow_idx), data)]
+    else:
+        T_values = [row[temp_idx] if len(row) > temp_idx and row[temp_idx] is not None else 0.0
+                    for row in data]
+        z_values = [row[snow_idx] if len(row) > snow_idx and row[snow_idx] is not None else 0.0
+                    for row in data]
+    return timestamps, locations, T_values, z_values
+
+
+def _conduction_factor(K_t, C_s, Z_s):
+    """Return K_t / (1.0e+06 * C_s * Z_s**2), the bucket's constant factor in delta_T."""
+    return K_t / (1.0e+06 * C_s * (Z_s**2))
+
+
+def _snow_insulation_factors(z_values, f_s):
+    """Return S = exp(f_s * z) for each snow depth, shared by every bucket of a landcover."""
+    _exp = math.exp
+    # exp(f_s * 0) is exactly 1.0, and snow-free steps are the common case
+    return [_exp(f_s * z) if z else 1.0 for z in z_values]
+
+
+def _simulate_bucket_python(T_values, scaled_S_values, T_0, time_scale, conduction):
+    """
+    Run the soil temperature recurrence for one bucket without numpy.
+    
+    scaled_S_values holds (D / 86400) * S for each timestep, or is None for
+    buckets that do not receive precipitation (S = 1.0).
+    """
+    # delta_T = (D / 86400) * S * (K_t / 1.0e+06*(C_s * (Z_s**2))) * (T - T_s0),
+    # multiplied left to right so the results match the formula exactly
     T_s0 = T_0
+    soil_temperatures = []
+    # Bind the append method once so the loops below only touch locals
+    append = soil_temperatures.append
+    
+    # Choose the loop once so buckets that do not receive precipitation
+    # skip the snow insulation factor entirely
+    if scaled_S_values is not None:
+        for T, scaled_S in zip(T_values, scaled_S_values):
+            T_s0 += scaled_S * conduction * (T - T_s0)
+            append(T_s0)
+    else:
+        # (D / 86400) * 1.0 is exact, so the constant factors can be combined
+        k = time_scale * conduction
+        for T in T_values:
+            T_s0 += k * (T - T_s0)
+            append(T_s0)
+    
+    return soil_temperatures
+
+
+def _simulate_buckets_numpy(T_values, z_values, bucket_values, K_t, C_s, f_s, D):
+    """Return a (buckets x timesteps) array of soil temperatures for buckets in one landcover (requires numba)."""
+    T_arr = np.array(T_values, dtype=np.float64)
+    z_arr = np.array(z_values, dtype=np.float64)
+    
+    T0_vec = np.array([T_0 for T_0, _, _ in bucket_values], dtype=np.float64)
+    Zs_vec = np.array([Z_s for _, Z_s, _ in bucket_values], dtype=np.float64)
+    rp_vec = np.array([bool(rp) for _, _, rp in bucket_values], dtype=np.bool_)
+    
+    # Buckets in one landcover share K_t, C_s, f_s and D, so the kernel built
+    # for those constants is reused by every landcover with the same values
+    Ts_out = np.empty((len(bucket_values), T_arr.size))
+    _make_soil_temp_kernel(K_t, C_s, f_s, D)(T_arr, z_arr, T0_vec, Zs_vec, rp_vec, Ts_out)
+    return Ts_out
+
+
+def _simulate_landcover_buckets(input_timeseries, bucket_list, landcover_params,
+                                timestep_seconds, temp_column, snow_column):
+    """Return one soil temperature TimeSeries per bucket, reading the input only once."""
+    K_t, C_s, f_s = _landcover_soil_parameters(landcover_params)
+    bucket_values = [_bucket_soil_parameters(bucket) for bucket in bucket_list]
+    
+    # Find column indices and extract the input columns once for all buckets
+    temp_idx, snow_idx = _find_input_columns(input_timeseries, temp_column, snow_column)
+    timestamps, locations, T_values, z_values = _extract_input_columns(
+        input_timeseries, temp_idx, snow_idx)
     
     # Scaling factor
     D = timestep_seconds
     
-    # Process each data point
-    for row in input_timeseries.data:
-        timestamp = row[timestamp_idx]
-        location = row[location_idx]
-        
-        # Get air temperature and snow depth
-        T = row[temp_idx] if len(row) > temp_idx and row[temp_idx] is not None else 0.0
-        z = row[snow_idx] if len(row) > snow_idx and row[snow_idx] is not None else 0.0
-        
-        # Calculate snow insulation factor
-        if receives_precipitation:
-            S = math.exp(f_s * z)
-        else:
-            S = 1.0
-        
-        # Calculate change in soil temperature
-        # delta_T = (D / 86400) * S * (K_t / 1.0e+06*(C_s * (Z_s**2))) * (T - T_s0)
-        delta_T = (D / 86400.0) * S * (K_t / (1.0e+06 * C_s * (Z_s**2))) * (T - T_s0)
-        
-        # Update soil temperature
-        T_s = T_s0 + delta_T
-        
-        # Add to output time series
-        output_ts.add_data(timestamp, location, {"soil_temperature_c": T_s})
-        
-        # Update previous temperature for next iteration
-        T_s0 = T_s
+    if HAS_NUMBA:
+        bucket_series = _simulate_buckets_numpy(
+            T_values, z_values, bucket_values, K_t, C_s, f_s, D).tolist()
+    else:
+        # Evaluate exp() once per timestep for the landcover rather than once
+        # per timestep for every bucket that receives precipitation
+        time_scale = D / 86400.0
+        scaled_S_values = None
+        if any(receives_precipitation for _, _, receives_precipitation in bucket_values):
+            scaled_S_values = [time_scale * S for S in _snow_insulation_factors(z_values, f_s)]
+        bucket_series = [
+            _simulate_bucket_python(T_values, scaled_S_values if receives_precipitation else None,
+                                    T_0, time_scale, _conduction_factor(K_t, C_s, Z_s))
+            for T_0, Z_s, receives_precipitation in bucket_values
+        ]
+    
+    base_metadata = _landcover_base_metadata(input_timeseries, landcover_params, timestep_seconds)
+    results = []
+    for bucket, soil_temperatures in zip(bucket_list, bucket_series):
+        output_ts = _create_bucket_timeseries(base_metadata, bucket)
+        output_ts.extend_column("soil_temperature_c", timestamps, locations, soil_temperatures)
+        results.append(output_ts)
     
-    return output_ts
+    return results
+
+
+def simulate_soil_temperature_for_bucket(
+    input_timeseries,
+    bucket_params,
+    landcover_params,
+    timestep_seconds=86400,
+    temp_column="air_temperature",
+    snow_column="snowpack_depth"
+):
+    """
+    Simulate soil temperature time series for a single bucket.
+    
+    Parameters:
+    input_timeseries: TimeSeries object with air temperature and snow depth data
+    bucket_params: Dict with bucket-specific parameters
+    landcover_params: Dict with landcover-specific soil temperature parameters  
+    timestep_seconds: Timestep scaling factor
+    temp_column: Name of temperature column
+    snow_column: Name of snow depth column
+    
+    Returns:
+    TimeSeries object with soil temperature values
+    """
+    return _simulate_landcover_buckets(
+        input_timeseries, [bucket_params], landcover_params,
+        timestep_seconds, temp_column, snow_column
+    )[0]
 
 
 def calculate_soil_temperature_with_landcover_params(
@@ -251,27 +532,35 @@ def calculate_soil_temperature_with_landcover_params(
     if not bucket_params:
         raise ValueError("No buckets found in landcover parameters")
     
-    results = {}
+    # All buckets share the same input, so its columns are read only once
+    bucket_results = _simulate_landcover_buckets(
+        input_timeseries, bucket_params, soil_temp_params,
+        timestep_seconds, temp_column, snow_column
+    )
     
-    # Process each bucket
-    for bucket in bucket_params:
-        bucket_name = bucket.get("name", "Unknown")
-        
-        # Calculate soil temperature for this bucket
-        bucket_ts = simulate_soil_temperature_for_bucket(
-            input_timeseries=input_timeseries,
-            bucket_params=bucket,
-            landcover_params=soil_temp_params,
-            timestep_seconds=timestep_seconds,
-            temp_column=temp_column,
-            snow_column=snow_column
-        )
-        
-        results[bucket_name] = bucket_ts
+    results = {}
+    for bucket, bucket_ts in zip(bucket_params, bucket_results):
+        results[bucket.get("name", "Unknown")] = bucket_ts
     
     return results
 
 
+def _parse_numeric_column(values):
+    """Convert a column of CSV strings to floats, keeping empty cells as None."""
+    try:
+        return list(map(float, values))
+    except ValueError:
+        pass
+    
+    column = []
+    for value in values:
+        try:
+            column.append(float(value) if value else None)
+        except ValueError:
+            column.append(value)
+    return column
+
+
 def load_timeseries_from_files(csv_path, json_path):
     """
     Load a time series from CSV and JSON files.
@@ -280,8 +569,8 @@ def load_timeseries_from_files(csv_path, json_path):
     """
     # Load metadata from JSON
     try:
-        with open(json_path, 'r') as f:
-            metadata = json.load(f)
+        with open(json_path, 'rb') as f:
+            metadata = _json_loads(f.read())
     except FileNotFoundError:
         print(f"Warning: JSON file {json_path} not found. Using defaults.")
         metadata = {}
@@ -298,6 +587,8 @@ def load_timeseries_from_files(csv_path, json_path):
             reader = csv.reader(f)
             columns = next(reader)  # First row is header
             
+            rows = []
+            timestamps = []
             for row in reader:
                 if not row:  # Skip empty rows
                     continue
@@ -313,18 +604,20 @@ def load_timeseries_from_files(csv_path, json_path):
                     except ValueError:
                         continue
                 
-                # Convert numeric values
-                processed_row = [timestamp]
-                for i, value in enumerate(row[1:], 1):
-                    if i == 1:  # Location column
-                        processed_row.append(value)
-                    else:
-                        try:
-                            processed_row.append(float(value) if value else None)
-                        except ValueError:
-                            processed_row.append(value)
-                
-                data.append(processed_row)
+                timestamps.append(timestamp)
+                rows.append(row)
+        
+        if rows:
+            # Convert the file column by column so numeric columns can be parsed in one pass
+            width = max(map(len, rows))
+            for row in rows:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+            
+            csv_columns = list(zip(*rows))
+            locations = csv_columns[1] if width > 1 else [None] * len(rows)
+            value_columns = [_parse_numeric_column(column) for column in csv_columns[2:]]
+            data = [list(row) for row in zip(timestamps, locations, *value_columns)]
     
     except FileNotFoundError:
         raise FileNotFoundError(f"CSV file {csv_path} not found")
@@ -341,6 +634,108 @@ def load_timeseries_from_files(csv_path, json_path):
     return ts
 
 
+def load_catchment_parameters(catchment_file_path):
+    """Load catchment parameters from JSON file."""
+    with open(catchment_file_path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_landcover_index(catchment_file_path, mtime):
+    """
+    Return {hru_name: {landcover_name: landcover_params}} for a catchment file.
+    
+    Cached on the file path and modification time, so repeated runs against
+    the same catchment file parse it only once. The returned dicts are shared
+    between calls and must not be modified.
+    """
+    catchment_data = load_catchment_parameters(catchment_file_path)
+    return {
+        hru.get("name"): {
+            landcover.get("name"): landcover
+            for landcover in hru.get("subcatchment", {}).get("landCoverTypes", [])
+        }
+        for hru in catchment_data.get("HRUs", [])
+    }
+
+
+def find_landcover_parameters(catchment_file_path, hru_name, landcover_name):
+    """Return the landcover parameters for an HRU/landcover pair, or None if not found."""
+    landcover_index = _load_landcover_index(catchment_file_path,
+                                            os.path.getmtime(catchment_file_path))
+    return landcover_index.get(hru_name, {}).get(landcover_name)
+
+
+def run_calculation(csv_path, json_path, catchment_path, output_dir=None):
+    """
+    Calculate and save soil temperature for every bucket of one HRU/landcover.
+    
+    The input is a rain and snow time series (air temperature and snowpack
+    depth); the HRU and landcover are taken from its metadata. No GUI modules
+    are imported, so this can be used from batch scripts.
+    
+    Parameters:
+    csv_path: Path to the rain and snow CSV file
+    json_path: Path to the rain and snow JSON metadata file
+    catchment_path: Path to the catchment structure JSON file
+    output_dir: Directory to save output files (defaults to current directory)
+    
+    Returns:
+    Dict of {bucket_name: (csv_file, json_file)} for the saved time series
+    """
+    input_ts = load_timeseries_from_files(csv_path, json_path)
+    hru_name = input_ts.metadata.get("hru_name")
+    landcover_name = input_ts.metadata.get("land_cover_type")
+    # Metadata written by this module stores the timestep as a string
+    timestep_value = input_ts.metadata.get("timestep_seconds", 86400)
+    try:
+        timestep_seconds = int(timestep_value)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"timestep_seconds in {json_path} must be a whole number of seconds, got {timestep_value!r}"
+        ) from None
+    
+    landcover_params = find_landcover_parameters(catchment_path, hru_name, landcover_name)
+    if landcover_params is None:
+        raise ValueError(f"Landcover '{landcover_name}' not found for HRU '{hru_name}' in {catchment_path}")
+    
+    bucket_results = calculate_soil_temperature_with_landcover_params(
+        input_ts, landcover_params, timestep_seconds=timestep_seconds
+    )
+    
+    output_files = {}
+    for bucket_name, soil_ts in bucket_results.items():
+        base_name = "_".join(
+            part.replace(" ", "_") for part in (hru_name, landcover_name, bucket_name)
+        ) + "_soilTemperature"
+        if output_dir:
+            base_name = os.path.join(output_dir, base_name)
+        output_files[bucket_name] = soil_ts.save_to_files(base_name)
+    
+    return output_files
+
+
+def main():
+    """Main function for command line usage."""
+    if len(sys.argv) < 4:
+        print("Usage: python calculate_soil_temperature.py <rain_snow_csv> <rain_snow_json> <catchment_json> [output_dir]")
+        print("\nExample:")
+        print("python calculate_soil_temperature.py Lower_Forest_rainAndSnow.csv Lower_Forest_rainAndSnow.json generated_catchment.json output/")
+        return
+    
+    csv_path = sys.argv[1]
+    json_path = sys.argv[2]
+    catchment_path = sys.argv[3]
+    output_dir = sys.argv[4] if len(sys.argv) > 4 else None
+    
+    output_files = run_calculation(csv_path, json_path, catchment_path, output_dir)
+    
+    print(f"Completed! Generated soil temperature for {len(output_files)} buckets:")
+    for csv_file, json_file in output_files.values():
+        print(f"  {csv_file}")
+        print(f"  {json_file}")
+
+
 def test_soil_temperature_calculation():
     """Test function to demonstrate soil temperature calculation."""
     print("Testing soil temperature calculation with landcover parameters...")
@@ -466,6 +861,46 @@ def test_soil_temperature_calculation():
     return soil_results
 
 
+def test_simplified_timeseries_data_view():
+    """Check that SimplifiedTimeSeries.data is read-only and follows every write path."""
+    print("Testing SimplifiedTimeSeries.data view...")
+    ts = SimplifiedTimeSeries("data_view_test")
+    ts.add_column("soil_temperature")
+    start = datetime.datetime(2020, 1, 1)
+    ts.add_data(start, "test", [1.5])
+    
+    rows = ts.data
+    assert rows == ((start, "test", 1.5),)
+    assert ts.data is rows, "data should be reused until the series changes"
+    
+    # Mutating the view must fail loudly rather than being silently lost
+    try:
+        rows.append((start, "test", 2.5))
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("data should not support append")
+    try:
+        rows[0][2] = 9.9
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("data rows should not support item assignment")
+    assert ts.data[0][2] == 1.5
+    
+    # Writes through the supported paths are visible in the next view
+    second = start + datetime.timedelta(days=1)
+    ts.add_data(second, "test", {"soil_temperature": 2.5})
+    assert ts.data[-1] == (second, "test", 2.5)
+    ts.extend_column("soil_temperature", [second + datetime.timedelta(days=1)], ["test"], [3.5])
+    assert [row[2] for row in ts.data] == [1.5, 2.5, 3.5]
+    ts.add_column("extra")
+    assert ts.data[0] == (start, "test", 1.5, None)
+    ts.data = [[start, "test", 4.5, 1.0]]
+    assert ts.data == ((start, "test", 4.5, 1.0),)
+    print("SimplifiedTimeSeries.data view behaves as expected")
+
+
 def show_calculation_info():
     """Display information about the soil temperature calculation method."""
     print("Soil Temperature Calculation Method:")
@@ -483,11 +918,17 @@ def show_calculation_info():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Run with command line arguments
+        main()
+        sys.exit()
+    
     # Show calculation information
     show_calculation_info()
     
     # Run test
     test_results = test_soil_temperature_calculation()
+    test_simplified_timeseries_data_view()
     
     print("\nKey features of this soil temperature calculator:")
     print("1. Calculates separate soil temperature for each bucket in a landcover")
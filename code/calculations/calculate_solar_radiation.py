@@ -80,14 +80,10 @@ class TimeSeries:
         with open(csv_filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(self.columns)
-            for row in self.data:
-                formatted_row = []
-                for i, value in enumerate(row):
-                    if i == 0 and isinstance(value, datetime.datetime):
-                        formatted_row.append(value.isoformat())
-                    else:
-                        formatted_row.append(value)
-                writer.writerow(formatted_row)
+            # add_data only accepts datetime timestamps, so the timestamp column
+            # is formatted in one pass instead of type-checking every cell
+            iso_timestamps = map(datetime.datetime.isoformat, (row[0] for row in self.data))
+            writer.writerows([ts] + row[1:] for ts, row in zip(iso_timestamps, self.data))
         
         # Save metadata to JSON
         with open(json_filename, 'w') as jsonfile:
@@ -144,17 +140,60 @@ def solar_radiation(dt, lat, longitude=0, timezone_offset=0):
     return radiation
 
 
+def make_solar_radiation(lat, longitude=0, timezone_offset=0):
+    """
+    Return a solar_radiation(dt) equivalent specialised for a single location.
+
+    The latitude terms and the longitude offset are the same for every step of
+    a series, so they are computed once and captured by the returned function
+    together with the math functions it needs. The remaining operations run in
+    the same order as in solar_radiation, so the results are identical.
+    """
+    sin, cos, asin, radians, degrees = math.sin, math.cos, math.asin, math.radians, math.degrees
+    lat_rad = radians(lat)
+    sin_lat = sin(lat_rad)
+    cos_lat = cos(lat_rad)
+    longitude_hours = longitude / 15
+
+    def radiation(dt):
+        day_of_year = dt.timetuple().tm_yday
+        hour = dt.hour + dt.minute / 60 + dt.second / 3600
+
+        # Same steps as solar_declination, solar_hour_angle and
+        # solar_elevation_angle, with the per-location terms precomputed
+        decl_rad = radians(23.45 * sin(radians(360 * (284 + day_of_year) / 365)))
+        ha_rad = radians(15 * (hour + longitude_hours - timezone_offset - 12))
+        elev = degrees(asin(sin_lat * sin(decl_rad) + cos_lat * cos(decl_rad) * cos(ha_rad)))
+
+        if elev <= 0:
+            return 0
+
+        I_0 = 1367 * (1 + 0.033 * cos(radians(360 * day_of_year / 365)))
+        return I_0 * 0.75 * sin(radians(elev))
+
+    return radiation
+
+
+def iter_radiation(start_time, end_time, step_seconds, latitude, longitude, timezone_offset):
+    """Yield (datetime, solar radiation) pairs over a time period."""
+    current_time = start_time
+    step = datetime.timedelta(seconds=step_seconds)
+    radiation_at = make_solar_radiation(latitude, longitude, timezone_offset)
+
+    while current_time <= end_time:
+        yield current_time, radiation_at(current_time)
+        current_time += step
+
+
 def compute_radiation_series(start_time, end_time, step_seconds, latitude, longitude, timezone_offset):
     """Compute solar radiation values over a time period."""
-    current_time = start_time
     times = []
     radiation = []
 
-    while current_time <= end_time:
-        rad = solar_radiation(current_time, latitude, longitude, timezone_offset)
+    for current_time, rad in iter_radiation(start_time, end_time, step_seconds,
+                                            latitude, longitude, timezone_offset):
         times.append(current_time)
         radiation.append(rad)
-        current_time += datetime.timedelta(seconds=step_seconds)
 
     return times, radiation
 
@@ -175,10 +214,6 @@ def compute_radiation_timeseries(start_time, end_time, step_seconds, latitude, l
     Returns:
         TimeSeries object with solar radiation data and metadata
     """
-    # Calculate radiation values
-    times, radiation_values = compute_radiation_series(start_time, end_time, step_seconds, 
-                                                      latitude, longitude, timezone_offset)
-    
     # Create TimeSeries object
     ts = TimeSeries()
     
@@ -192,14 +227,17 @@ def compute_radiation_timeseries(start_time, end_time, step_seconds, latitude, l
     ts.add_metadata("start_time", start_time.isoformat())
     ts.add_metadata("end_time", end_time.isoformat())
     ts.add_metadata("step_seconds", str(step_seconds))
-    ts.add_metadata("num_records", str(len(times)))
     
     # Add column for solar radiation
     ts.add_column("solar_radiation")
     
-    # Add data to TimeSeries
-    for i in range(len(times)):
-        ts.add_data(times[i], location_id, [radiation_values[i]])
+    # Stream radiation values straight into the TimeSeries rather than
+    # building intermediate lists of times and values first
+    for current_time, rad in iter_radiation(start_time, end_time, step_seconds,
+                                            latitude, longitude, timezone_offset):
+        ts.add_data(current_time, location_id, [rad])
+    
+    ts.add_metadata("num_records", str(len(ts.data)))
     
     return ts
 
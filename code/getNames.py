@@ -1,16 +1,201 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
+import concurrent.futures
+import functools
+import mmap
+import os
 from typing import Dict, List, Any
 
+# Files are always written with the standard library encoder so their
+# formatting does not depend on which packages are installed.
+# json.dumps(indent=2) builds a new encoder per call; reuse one instead
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps(obj):
+    return _ENCODER.encode(obj).encode('utf-8')
+
+
+# Try to import orjson for faster JSON parsing
+try:
+    import orjson
+    HAS_ORJSON = True
+    
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity that json.dump writes; let json decide
+            return json.loads(bytes(data))
+except ImportError:
+    HAS_ORJSON = False
+    _loads = json.loads
+
+def _write_bytes(filename: str, data: bytes) -> None:
+    """Write bytes to a file (runs on the I/O worker thread)"""
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def _encode_and_write(filename: str, payload: Dict[str, Any]) -> bytes:
+    """Serialize payload and write it to a file, returning the bytes (runs on the I/O worker thread)"""
+    json_bytes = _dumps(payload)
+    _write_bytes(filename, json_bytes)
+    return json_bytes
+
+
+# Preview text longer than _CHUNKED_INSERT_MIN characters is inserted
+# _INSERT_CHUNK_SIZE characters at a time so the window keeps redrawing
+_CHUNKED_INSERT_MIN = 131072
+_INSERT_CHUNK_SIZE = 65536
+
+# Files at least this large are parsed straight from a memory map when orjson is available
+_MMAP_MIN_SIZE = 4096
+
+
+def _read_json(filename: str) -> Any:
+    """Read and parse a JSON file (runs on the I/O worker thread)"""
+    # The file is read in one call, so skip BufferedReader's intermediate buffer
+    with open(filename, 'rb', buffering=0) as f:
+        if HAS_ORJSON and os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _loads(view)
+        return _loads(f.read())
+
+@functools.lru_cache(maxsize=64)
+def _parse_float(text: str) -> float:
+    """float() for entry text; repeated values such as the "1.0" default are cached"""
+    return float(text)
+
+
+def _item_label(item: Dict[str, Any]) -> str:
+    """Listbox label for a name/abbreviation item"""
+    return f"{item.get('name', '')} ({item.get('abbreviation', '')})"
+
+
+def _grain_label(item: Dict[str, Any]) -> str:
+    """Listbox label for a grain size class item"""
+    return (f"{item.get('name', '')} ({item.get('abbreviation', '')}) - "
+            f"{item.get('minimumSize', '')}-{item.get('maximumSize', '')}mm")
+
+def _validate_grain_sizes(item: Dict[str, Any]) -> bool:
+    """Convert a grain size item's sizes to floats in place, reporting invalid values"""
+    try:
+        min_size = _parse_float(item["minimumSize"])
+        max_size = _parse_float(item["maximumSize"])
+    except ValueError:
+        messagebox.showerror("Value Error", "Please enter valid numeric values for sizes.")
+        return False
+    
+    # One chained comparison covers both non-negative sizes and min <= max (and rejects NaN);
+    # the specific message is only worked out once it fails
+    if not (0.0 <= min_size <= max_size):
+        if min_size < 0 or max_size < 0:
+            message = "Size values must be non-negative."
+        elif min_size > max_size:
+            message = "Minimum size cannot be greater than maximum size."
+        else:
+            message = "Please enter valid numeric values for sizes."
+        messagebox.showerror("Value Error", message)
+        return False
+    
+    item["minimumSize"] = min_size
+    item["maximumSize"] = max_size
+    return True
+
+# Entry fields: (item key, label, help text suffix, entry width, default)
+CATCHMENT_FIELDS = (
+    ("name", "Name:", "name", 40, ""),
+    ("abbreviation", "Abbreviation:", "abbrev", 40, ""),
+)
+NAME_FIELDS = (
+    ("name", "Name:", "name", 30, ""),
+    ("abbreviation", "Abbreviation:", "abbrev", 15, ""),
+)
+GRAIN_SIZE_FIELDS = (
+    ("name", "Name:", "name", 25, ""),
+    ("abbreviation", "Abbreviation:", "abbrev", 15, ""),
+    ("minimumSize", "Min Size (mm):", "min_size", 15, "1.0"),
+    ("maximumSize", "Max Size (mm):", "max_size", 15, "1.0"),
+)
+
+# List tabs in notebook order; help_prefix selects the help texts and entry variables
+TABS = (
+    {"title": "HRU", "data_key": "HRU", "help_prefix": "hru", "fields": NAME_FIELDS,
+     "add_text": "Add", "remove_text": "Remove", "label": _item_label, "validate": None},
+    {"title": "Land Cover Type", "data_key": "landCoverType", "help_prefix": "landcover", "fields": NAME_FIELDS,
+     "add_text": "Add", "remove_text": "Remove", "label": _item_label, "validate": None},
+    {"title": "Bucket", "data_key": "bucket", "help_prefix": "bucket", "fields": NAME_FIELDS,
+     "add_text": "Add", "remove_text": "Remove", "label": _item_label, "validate": None},
+    {"title": "Grain Size Class", "data_key": "grainSizeClass", "help_prefix": "grain", "fields": GRAIN_SIZE_FIELDS,
+     "add_text": "Add Grain Size Class", "remove_text": "Remove Selected", "label": _grain_label,
+     "validate": _validate_grain_sizes},
+)
+
+# (version, value) placeholder for an empty serialization cache
+_STALE_CACHE = (-1, None)
+
+# Top-level keys written to names.json, in output order (no "defs" block);
+# _empty_data() creates them in this order and loading only replaces values
+PAYLOAD_KEYS = ("catchment", "HRU", "landCoverType", "bucket", "grainSizeClass")
+
+
+def _empty_data() -> Dict[str, Any]:
+    """Return a fresh, empty names.json data structure"""
+    return {
+        "catchment": {"name": "", "abbreviation": ""},
+        "HRU": [],
+        "landCoverType": [],
+        "bucket": [],
+        "grainSizeClass": []
+    }
+
 class ToolTip:
     """Create a tooltip for a given widget"""
+    # Every tooltip widget carries the TAG bindtag, so one pair of class
+    # bindings serves them all; the handlers find the ToolTip by widget path
+    TAG = "ToolTip"
+    _registry: Dict[str, "ToolTip"] = {}
+    _bound_interp = None
+    
+    # A single tip window is shared by all tooltips: created on first hover,
+    # then re-labelled and moved on each show and withdrawn on leave
+    _pool = None
+    _pool_label = None
+    _pool_owner = None
+    
     def __init__(self, widget, text='widget info'):
         self.widget = widget
         self.text = text
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
-        self.tipwindow = None
+        
+        if ToolTip._bound_interp is not widget.tk:
+            widget.bind_class(self.TAG, "<Enter>", ToolTip._on_enter)
+            widget.bind_class(self.TAG, "<Leave>", ToolTip._on_leave)
+            widget.bind_class(self.TAG, "<Destroy>", ToolTip._on_destroy)
+            ToolTip._bound_interp = widget.tk
+        self.attach(widget)
+    
+    def attach(self, widget):
+        """Also show this tooltip while hovering over another widget, e.g. a field's label"""
+        ToolTip._registry[str(widget)] = self
+        widget.bindtags((self.TAG,) + tuple(widget.bindtags()))
+    
+    @staticmethod
+    def _on_enter(event):
+        tip = ToolTip._registry.get(str(event.widget))
+        if tip is not None:
+            tip.enter(event)
+    
+    @staticmethod
+    def _on_leave(event):
+        tip = ToolTip._registry.get(str(event.widget))
+        if tip is not None:
+            tip.leave(event)
+    
+    @staticmethod
+    def _on_destroy(event):
+        ToolTip._registry.pop(str(event.widget), None)
         
     def enter(self, event=None):
         self.showtip()
@@ -19,24 +204,28 @@ class ToolTip:
         self.hidetip()
         
     def showtip(self):
-        if self.tipwindow or not self.text:
+        if ToolTip._pool_owner is self or not self.text:
             return
         x, y, cx, cy = self.widget.bbox("insert")
         x = x + self.widget.winfo_rootx() + 25
         y = y + cy + self.widget.winfo_rooty() + 25
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
+        tw = ToolTip._pool
+        if tw is None or not tw.winfo_exists():
+            tw = ToolTip._pool = tk.Toplevel(self.widget.winfo_toplevel())
+            tw.wm_overrideredirect(True)
+            ToolTip._pool_label = tk.Label(tw, justify=tk.LEFT,
+                                           background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                           font=("tahoma", "8", "normal"), wraplength=300)
+            ToolTip._pool_label.pack(ipadx=1)
+        ToolTip._pool_label.configure(text=self.text)
         tw.wm_geometry("+%d+%d" % (x, y))
-        label = tk.Label(tw, text=self.text, justify=tk.LEFT,
-                        background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                        font=("tahoma", "8", "normal"), wraplength=300)
-        label.pack(ipadx=1)
+        tw.deiconify()
+        ToolTip._pool_owner = self
         
     def hidetip(self):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw:
-            tw.destroy()
+        if ToolTip._pool_owner is self:
+            ToolTip._pool_owner = None
+            ToolTip._pool.withdraw()
 
 class JSONGeneratorApp:
     def __init__(self, root):
@@ -44,14 +233,13 @@ class JSONGeneratorApp:
         self.root.title("JSON Generator - names.json Schema")
         self.root.geometry("800x600")
         
+        # Shared label styles, so each tab reuses one font instead of resolving its own
+        style = ttk.Style(self.root)
+        style.configure("Title.TLabel", font=("Arial", 14, "bold"))
+        style.configure("Help.TLabel", font=("Arial", 9), foreground="blue")
+        
         # Data storage
-        self.data = {
-            "catchment": {"name": "", "abbreviation": ""},
-            "HRU": [],
-            "landCoverType": [],
-            "bucket": [],
-            "grainSizeClass": []
-        }
+        self.data = _empty_data()
         
         # Schema-based help text
         self.help_texts = {
@@ -69,6 +257,37 @@ class JSONGeneratorApp:
             "grain_max_size": "Maximum mesh size, in millimetres, that will retain a particle (minimum: 0.0, default: 1.0)"
         }
         
+        # Serialized JSON is reused by Preview/Save until the data changes;
+        # every mutation bumps the version
+        self._version = 0
+        self._json_cache = _STALE_CACHE
+        self._text_cache = _STALE_CACHE
+        
+        # Set when a catchment entry is edited, so update_data only reads them then
+        self._catchment_dirty = True
+        
+        # The JSON window is created once and refreshed while it stays open
+        self._preview_win = None
+        self._preview_text = None
+        self._preview_version = -1
+        
+        # StringVars bound to the entry fields, keyed like the help texts,
+        # and the value each one is reset to
+        self._vars = {}
+        self._var_defaults = {}
+        
+        # Per-tab entry variables in field order, resolved once when the tab is built
+        self._field_vars = {}
+        
+        # Per-tab listbox models: data key -> (listbox, items_var, label formatter);
+        # the labels live only in Tk, derived from the item dicts in self.data
+        self._list_models = {}
+        
+        # File reads and writes run on a worker thread so the window stays responsive;
+        # a single worker keeps overlapping saves in the order they were made
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         self.create_widgets()
         
     def create_widgets(self):
@@ -79,17 +298,9 @@ class JSONGeneratorApp:
         # Catchment tab
         self.create_catchment_tab(notebook)
         
-        # HRU tab
-        self.create_array_tab(notebook, "HRU", "HRU")
-        
-        # Land Cover Type tab
-        self.create_array_tab(notebook, "Land Cover Type", "landCoverType")
-        
-        # Bucket tab
-        self.create_array_tab(notebook, "Bucket", "bucket")
-        
-        # Grain Size Class tab
-        self.create_grain_size_tab(notebook)
+        # HRU, Land Cover Type, Bucket and Grain Size Class tabs
+        for tab in TABS:
+            self.create_list_tab(notebook, tab)
         
         # Control buttons
         self.create_control_buttons()
@@ -98,253 +309,128 @@ class JSONGeneratorApp:
         frame = ttk.Frame(notebook)
         notebook.add(frame, text="Catchment")
         
-        # Title
-        title_label = ttk.Label(frame, text="Catchment Information", font=("Arial", 14, "bold"))
-        title_label.pack(pady=10)
-        
-        # Help info
-        help_frame = ttk.Frame(frame)
-        help_frame.pack(pady=5)
-        help_label = ttk.Label(help_frame, text="ℹ️ Hover over fields for help", 
-                              font=("Arial", 9), foreground="blue")
-        help_label.pack()
+        self._add_heading(frame, "Catchment Information")
         
         # Input frame
         input_frame = ttk.Frame(frame)
         input_frame.pack(pady=20)
         
-        # Name field
-        name_label = ttk.Label(input_frame, text="Name:")
-        name_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        ToolTip(name_label, self.help_texts["catchment_name"])
-        
-        self.catchment_name = ttk.Entry(input_frame, width=40)
-        self.catchment_name.grid(row=0, column=1, padx=5, pady=5)
-        ToolTip(self.catchment_name, self.help_texts["catchment_name"])
-        
-        # Abbreviation field
-        abbrev_label = ttk.Label(input_frame, text="Abbreviation:")
-        abbrev_label.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        ToolTip(abbrev_label, self.help_texts["catchment_abbrev"])
-        
-        self.catchment_abbrev = ttk.Entry(input_frame, width=40)
-        self.catchment_abbrev.grid(row=1, column=1, padx=5, pady=5)
-        ToolTip(self.catchment_abbrev, self.help_texts["catchment_abbrev"])
-        
-    def create_array_tab(self, notebook, tab_name, data_key):
+        # One field per row; every edit invalidates the cached JSON
+        for row, (item_key, label_text, help_suffix, width, default) in enumerate(CATCHMENT_FIELDS):
+            _, var = self._add_field(input_frame, row, 0, f"catchment_{help_suffix}",
+                                     label_text, width, default, pady=5)
+            var.trace_add("write", self._mark_catchment_changed)
+    
+    def _add_heading(self, frame, title):
+        """Pack a tab's title and help hint, styled by the shared label styles"""
+        ttk.Label(frame, text=title, style="Title.TLabel").pack(pady=10)
+        ttk.Label(frame, text="ℹ️ Hover over fields for help", style="Help.TLabel").pack(pady=5)
+    
+    def _add_field(self, parent, row, column, var_key, label_text, width, default="", pady=2):
+        """Grid a label/entry pair bound to a new StringVar, with one tooltip for both"""
+        label = ttk.Label(parent, text=label_text)
+        label.grid(row=row, column=column, sticky="w", padx=5, pady=pady)
+        
+        var = self._vars[var_key] = tk.StringVar(value=default)
+        self._var_defaults[var_key] = default
+        entry = ttk.Entry(parent, width=width, textvariable=var)
+        entry.grid(row=row, column=column + 1, padx=5, pady=pady)
+        ToolTip(entry, self.help_texts[var_key]).attach(label)
+        return entry, var
+        
+    def create_list_tab(self, notebook, tab):
+        """Build a list management tab from one of the TABS descriptions"""
+        data_key = tab["data_key"]
         frame = ttk.Frame(notebook)
-        notebook.add(frame, text=tab_name)
+        notebook.add(frame, text=tab["title"])
         
-        # Title
-        title_label = ttk.Label(frame, text=f"{tab_name} Management", font=("Arial", 14, "bold"))
-        title_label.pack(pady=10)
-        
-        # Help info
-        help_frame = ttk.Frame(frame)
-        help_frame.pack(pady=5)
-        help_label = ttk.Label(help_frame, text="ℹ️ Hover over fields for help", 
-                              font=("Arial", 9), foreground="blue")
-        help_label.pack()
+        self._add_heading(frame, f"{tab['title']} Management")
         
         # Input frame
         input_frame = ttk.Frame(frame)
         input_frame.pack(pady=10)
         
-        # Get help text keys based on data_key
-        name_help_key = f"{data_key.lower()}_name" if data_key.lower() in ["hru", "landcovertype"] else f"{data_key}_name"
-        abbrev_help_key = f"{data_key.lower()}_abbrev" if data_key.lower() in ["hru", "landcovertype"] else f"{data_key}_abbrev"
-        
-        # Adjust for landCoverType
-        if data_key == "landCoverType":
-            name_help_key = "landcover_name"
-            abbrev_help_key = "landcover_abbrev"
-        elif data_key == "HRU":
-            name_help_key = "hru_name"
-            abbrev_help_key = "hru_abbrev"
-        
-        name_label = ttk.Label(input_frame, text="Name:")
-        name_label.grid(row=0, column=0, sticky="w", padx=5)
-        ToolTip(name_label, self.help_texts.get(name_help_key, "Name for this item"))
-        
-        name_entry = ttk.Entry(input_frame, width=30)
-        name_entry.grid(row=0, column=1, padx=5)
-        ToolTip(name_entry, self.help_texts.get(name_help_key, "Name for this item"))
-        
-        abbrev_label = ttk.Label(input_frame, text="Abbreviation:")
-        abbrev_label.grid(row=0, column=2, sticky="w", padx=5)
-        ToolTip(abbrev_label, self.help_texts.get(abbrev_help_key, "Abbreviation for this item"))
-        
-        abbrev_entry = ttk.Entry(input_frame, width=15)
-        abbrev_entry.grid(row=0, column=3, padx=5)
-        ToolTip(abbrev_entry, self.help_texts.get(abbrev_help_key, "Abbreviation for this item"))
-        
-        def add_item():
-            name = name_entry.get().strip()
-            abbrev = abbrev_entry.get().strip()
-            
-            if not name or not abbrev:
-                messagebox.showwarning("Input Error", "Please fill in both name and abbreviation.")
-                return
-                
-            item = {"name": name, "abbreviation": abbrev}
-            self.data[data_key].append(item)
-            
-            listbox.insert(tk.END, f"{name} ({abbrev})")
-            name_entry.delete(0, tk.END)
-            abbrev_entry.delete(0, tk.END)
-        
-        def remove_item():
-            selection = listbox.curselection()
-            if not selection:
-                messagebox.showwarning("Selection Error", "Please select an item to remove.")
-                return
-                
-            index = selection[0]
-            listbox.delete(index)
-            del self.data[data_key][index]
-        
-        # Buttons
+        # Fields are laid out two per row as label/entry pairs
+        field_vars = []
+        for i, (item_key, label_text, help_suffix, width, default) in enumerate(tab["fields"]):
+            row, column = divmod(i, 2)
+            column *= 2
+            _, var = self._add_field(input_frame, row, column, f"{tab['help_prefix']}_{help_suffix}",
+                                     label_text, width, default)
+            field_vars.append(var)
+        self._field_vars[data_key] = tuple(field_vars)
+        
+        # Buttons sit beside a single row of fields, or below several rows
         button_frame = ttk.Frame(input_frame)
-        button_frame.grid(row=0, column=4, padx=10)
-        
-        ttk.Button(button_frame, text="Add", command=add_item).pack(side=tk.LEFT, padx=2)
-        ttk.Button(button_frame, text="Remove", command=remove_item).pack(side=tk.LEFT, padx=2)
-        
-        # Listbox with scrollbar
+        if len(tab["fields"]) <= 2:
+            button_frame.grid(row=0, column=4, padx=10)
+        else:
+            button_frame.grid(row=(len(tab["fields"]) + 1) // 2, column=0, columnspan=4, pady=10)
+        
+        ttk.Button(button_frame, text=tab["add_text"],
+                   command=functools.partial(self._add_item, tab)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text=tab["remove_text"],
+                   command=functools.partial(self._remove_item, data_key)).pack(side=tk.LEFT, padx=2)
+        
+        # Listbox with scrollbar; it shows labels through items_var, so the
+        # whole list is pushed to Tk in one call
         list_frame = ttk.Frame(frame)
         list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        listbox = tk.Listbox(list_frame)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=listbox.yview)
-        listbox.configure(yscrollcommand=scrollbar.set)
+        items_var = tk.StringVar(value=())
+        listbox = self._pack_scrolled(list_frame, tk.Listbox, listvariable=items_var)
         
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._list_models[data_key] = (listbox, items_var, tab["label"])
+    
+    def _pack_scrolled(self, parent, widget_cls, **kw):
+        """Create widget_cls in parent with a vertical scrollbar, wired up and packed"""
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL)
+        widget = widget_cls(parent, yscrollcommand=scrollbar.set, **kw)
+        scrollbar.configure(command=widget.yview)
         
-    def create_grain_size_tab(self, notebook):
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Grain Size Class")
+        widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        return widget
+    
+    def _add_item(self, tab: Dict[str, Any]) -> None:
+        """Validate a tab's entry fields and append them as a new item"""
+        fields = tab["fields"]
+        data_key = tab["data_key"]
+        field_vars = self._field_vars[data_key]
+        item = {field[0]: var.get().strip() for field, var in zip(fields, field_vars)}
+        
+        if not item["name"] or not item["abbreviation"]:
+            messagebox.showwarning("Input Error", "Please fill in both name and abbreviation.")
+            return
         
-        # Title
-        title_label = ttk.Label(frame, text="Grain Size Class Management", font=("Arial", 14, "bold"))
-        title_label.pack(pady=10)
+        if tab["validate"] is not None and not tab["validate"](item):
+            return
         
-        # Help info
-        help_frame = ttk.Frame(frame)
-        help_frame.pack(pady=5)
-        help_label = ttk.Label(help_frame, text="ℹ️ Hover over fields for help", 
-                              font=("Arial", 9), foreground="blue")
-        help_label.pack()
+        self.data[data_key].append(item)
+        self._mark_changed()
         
-        # Input frame
-        input_frame = ttk.Frame(frame)
-        input_frame.pack(pady=10)
+        # Append just the new row to the widget (Tk updates items_var itself)
+        listbox, _, formatter = self._list_models[data_key]
+        listbox.insert(tk.END, formatter(item))
         
-        # Row 0: Name and Abbreviation
-        name_label = ttk.Label(input_frame, text="Name:")
-        name_label.grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        ToolTip(name_label, self.help_texts["grain_name"])
-        
-        name_entry = ttk.Entry(input_frame, width=25)
-        name_entry.grid(row=0, column=1, padx=5, pady=2)
-        ToolTip(name_entry, self.help_texts["grain_name"])
-        
-        abbrev_label = ttk.Label(input_frame, text="Abbreviation:")
-        abbrev_label.grid(row=0, column=2, sticky="w", padx=5, pady=2)
-        ToolTip(abbrev_label, self.help_texts["grain_abbrev"])
-        
-        abbrev_entry = ttk.Entry(input_frame, width=15)
-        abbrev_entry.grid(row=0, column=3, padx=5, pady=2)
-        ToolTip(abbrev_entry, self.help_texts["grain_abbrev"])
-        
-        # Row 1: Size dimensions
-        min_size_label = ttk.Label(input_frame, text="Min Size (mm):")
-        min_size_label.grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        ToolTip(min_size_label, self.help_texts["grain_min_size"])
-        
-        min_size_entry = ttk.Entry(input_frame, width=15)
-        min_size_entry.grid(row=1, column=1, padx=5, pady=2)
-        min_size_entry.insert(0, "1.0")  # Default value
-        ToolTip(min_size_entry, self.help_texts["grain_min_size"])
-        
-        max_size_label = ttk.Label(input_frame, text="Max Size (mm):")
-        max_size_label.grid(row=1, column=2, sticky="w", padx=5, pady=2)
-        ToolTip(max_size_label, self.help_texts["grain_max_size"])
-        
-        max_size_entry = ttk.Entry(input_frame, width=15)
-        max_size_entry.grid(row=1, column=3, padx=5, pady=2)
-        max_size_entry.insert(0, "1.0")  # Default value
-        ToolTip(max_size_entry, self.help_texts["grain_max_size"])
-        
-        def add_grain_size():
-            name = name_entry.get().strip()
-            abbrev = abbrev_entry.get().strip()
-            
-            if not name or not abbrev:
-                messagebox.showwarning("Input Error", "Please fill in both name and abbreviation.")
-                return
-            
-            try:
-                min_size = float(min_size_entry.get())
-                max_size = float(max_size_entry.get())
-                
-                if min_size < 0 or max_size < 0:
-                    messagebox.showerror("Value Error", "Size values must be non-negative.")
-                    return
-                    
-                if min_size > max_size:
-                    messagebox.showerror("Value Error", "Minimum size cannot be greater than maximum size.")
-                    return
-                    
-            except ValueError:
-                messagebox.showerror("Value Error", "Please enter valid numeric values for sizes.")
-                return
-            
-            item = {
-                "name": name,
-                "abbreviation": abbrev,
-                "minimumSize": min_size,
-                "maximumSize": max_size
-            }
-            
-            self.data["grainSizeClass"].append(item)
-            listbox.insert(tk.END, f"{name} ({abbrev}) - {min_size}-{max_size}mm")
+        # Reset the entries to their defaults
+        for field, var in zip(fields, field_vars):
+            var.set(field[4])
+    
+    def _remove_item(self, data_key):
+        """Remove the selected item from a tab's list"""
+        listbox, _, _ = self._list_models[data_key]
+        selection = listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Selection Error", "Please select an item to remove.")
+            return
             
-            # Clear entries
-            name_entry.delete(0, tk.END)
-            abbrev_entry.delete(0, tk.END)
-            min_size_entry.delete(0, tk.END)
-            min_size_entry.insert(0, "1.0")
-            max_size_entry.delete(0, tk.END)
-            max_size_entry.insert(0, "1.0")
-        
-        def remove_grain_size():
-            selection = listbox.curselection()
-            if not selection:
-                messagebox.showwarning("Selection Error", "Please select an item to remove.")
-                return
-                
-            index = selection[0]
-            listbox.delete(index)
-            del self.data["grainSizeClass"][index]
-        
-        # Buttons
-        button_frame = ttk.Frame(input_frame)
-        button_frame.grid(row=2, column=0, columnspan=4, pady=10)
-        
-        ttk.Button(button_frame, text="Add Grain Size Class", command=add_grain_size).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Remove Selected", command=remove_grain_size).pack(side=tk.LEFT, padx=5)
-        
-        # Listbox with scrollbar
-        list_frame = ttk.Frame(frame)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        listbox = tk.Listbox(list_frame)
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=listbox.yview)
-        listbox.configure(yscrollcommand=scrollbar.set)
-        
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Delete just this row from the widget (Tk updates items_var itself)
+        # rather than re-sending every remaining label
+        index = selection[0]
+        listbox.delete(index)
+        del self.data[data_key][index]
+        self._mark_changed()
     
     def create_control_buttons(self):
         button_frame = ttk.Frame(self.root)
@@ -370,71 +456,168 @@ class JSONGeneratorApp:
         preview_btn = ttk.Button(button_frame, text="Preview JSON", command=self.preview_json)
         preview_btn.pack(side=tk.LEFT, padx=5)
         ToolTip(preview_btn, "Preview the current JSON structure without saving")
+        
+        # Shows "Saving…"/"Loading…" while file I/O is in progress
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side=tk.LEFT, padx=5)
     
-    def update_data(self):
+    def _run_io(self, status, on_done, func, *args):
+        """Run func on the I/O worker and call on_done(future) on the Tk thread once it finishes"""
+        self.status_label.config(text=status)
+        self._poll_io(self._io_pool.submit(func, *args), on_done)
+    
+    def _on_close(self):
+        """Drop queued I/O and close the window; a write already in progress still finishes"""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def _poll_io(self, future, on_done):
+        """Check a pending I/O future from the Tk event loop"""
+        if not future.done():
+            self.root.after(50, self._poll_io, future, on_done)
+            return
+        self.status_label.config(text="")
+        on_done(future)
+    
+    def update_data(self) -> None:
         """Update the data dictionary with current form values"""
-        self.data["catchment"]["name"] = self.catchment_name.get().strip()
-        self.data["catchment"]["abbreviation"] = self.catchment_abbrev.get().strip()
+        if not self._catchment_dirty:
+            return
+        self._catchment_dirty = False
+        catchment = self.data["catchment"]
+        for item_key, _, help_suffix, _, _ in CATCHMENT_FIELDS:
+            catchment[item_key] = self._vars[f"catchment_{help_suffix}"].get().strip()
     
-    def generate_json(self):
-        """Generate and display JSON in a new window"""
+    def _refresh_list(self, data_key):
+        """Rebuild a tab's listbox from self.data in a single Tk call"""
+        _, items_var, formatter = self._list_models[data_key]
+        items_var.set(tuple(map(formatter, self.data[data_key])))
+    
+    def _mark_changed(self, *args):
+        """Invalidate the cached JSON after any change to the data"""
+        self._version += 1
+        # Drop the stale copies now rather than holding them until the next encode
+        self._json_cache = self._text_cache = _STALE_CACHE
+    
+    def _mark_catchment_changed(self, *args):
+        """Note a catchment entry edit so update_data re-reads the entries"""
+        self._catchment_dirty = True
+        self._mark_changed()
+    
+    def _build_payload(self) -> Dict[str, Any]:
+        """Return the names.json structure for the current form values"""
         self.update_data()
+        # self.data holds exactly PAYLOAD_KEYS, in order, so it is encoded as is
+        return self.data
+    
+    def _serialize(self) -> bytes:
+        """Return the UTF-8 JSON for the current data, reusing the cached copy when unchanged"""
+        version, json_bytes = self._json_cache
+        if version != self._version:
+            json_bytes = _dumps(self._build_payload())
+            self._json_cache = (self._version, json_bytes)
+        return json_bytes
+    
+    def _serialized_text(self) -> str:
+        """Return the cached JSON bytes decoded for display, decoding once per version"""
+        json_bytes = self._serialize()
+        version, json_str = self._text_cache
+        if version != self._version:
+            json_str = json_bytes.decode('utf-8')
+            self._text_cache = (self._version, json_str)
+        return json_str
+    
+    def _show_json_window(self):
+        """Display the current JSON read-only, reusing the preview window if it is open"""
+        json_str = self._serialized_text()
+        
+        if self._preview_win is not None and self._preview_win.winfo_exists():
+            # Only replace the text if the data changed since it was shown
+            if self._preview_version != self._version:
+                self._preview_text.config(state=tk.NORMAL)
+                self._set_text(self._preview_text, json_str)
+                self._preview_text.config(state=tk.DISABLED)
+            self._preview_win.lift()
+        else:
+            json_window = tk.Toplevel(self.root)
+            json_window.title("Generated JSON")
+            json_window.geometry("600x500")
+            json_window.protocol("WM_DELETE_WINDOW", self._on_preview_close)
+            
+            text_widget = self._pack_scrolled(json_window, tk.Text, wrap=tk.WORD)
+            self._set_text(text_widget, json_str)
+            text_widget.config(state=tk.DISABLED)
+            
+            self._preview_win = json_window
+            self._preview_text = text_widget
         
-        # Create the final JSON structure without definitions
-        json_data = {
-            "catchment": self.data["catchment"],
-            "HRU": self.data["HRU"],
-            "landCoverType": self.data["landCoverType"],
-            "bucket": self.data["bucket"],
-            "grainSizeClass": self.data["grainSizeClass"]
-        }
-        
-        # Display in new window
-        json_window = tk.Toplevel(self.root)
-        json_window.title("Generated JSON")
-        json_window.geometry("600x500")
-        
-        text_widget = tk.Text(json_window, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(json_window, orient=tk.VERTICAL, command=text_widget.yview)
-        text_widget.configure(yscrollcommand=scrollbar.set)
-        
-        json_str = json.dumps(json_data, indent=2)
-        text_widget.insert(tk.END, json_str)
-        text_widget.config(state=tk.DISABLED)
-        
-        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._preview_version = self._version
+    
+    def _on_preview_close(self):
+        """Forget the preview window when the user closes it"""
+        self._preview_win.destroy()
+        self._preview_win = None
+        self._preview_text = None
+    
+    def _set_text(self, text_widget, text):
+        """Replace a Text widget's contents, in chunks with idle processing in between when large"""
+        if len(text) <= _CHUNKED_INSERT_MIN:
+            # A single Tcl call swaps the old contents for the new
+            text_widget.replace("1.0", tk.END, text)
+            return
+        text_widget.delete("1.0", tk.END)
+        start = 0
+        while start < len(text):
+            # End chunks on a line break so no line is laid out twice
+            end = start + _INSERT_CHUNK_SIZE
+            if end < len(text):
+                end = text.rfind("\n", start, end) + 1 or end
+            text_widget.insert(tk.END, text[start:end])
+            self.root.update_idletasks()
+            start = end
+    
+    def generate_json(self):
+        """Generate and display JSON in the preview window"""
+        self._show_json_window()
     
     def preview_json(self):
         """Preview the current JSON structure"""
-        self.generate_json()
+        self._show_json_window()
     
     def save_to_file(self):
         """Save JSON to file"""
-        self.update_data()
-        
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
             title="Save JSON File"
         )
         
-        if filename:
-            try:
-                json_data = {
-                    "catchment": self.data["catchment"],
-                    "HRU": self.data["HRU"],
-                    "landCoverType": self.data["landCoverType"],
-                    "bucket": self.data["bucket"],
-                    "grainSizeClass": self.data["grainSizeClass"]
-                }
-                
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-                
-                messagebox.showinfo("Success", f"JSON file saved successfully to:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
+        if not filename:
+            return
+        
+        version, json_bytes = self._json_cache
+        if version == self._version:
+            self._run_io("Saving…", lambda future: self._on_save_done(future, filename, version),
+                         _write_bytes, filename, json_bytes)
+        else:
+            # Encode on the worker too, from a snapshot the form cannot change underneath it
+            version = self._version
+            self._run_io("Saving…", lambda future: self._on_save_done(future, filename, version),
+                         _encode_and_write, filename, self._snapshot_payload())
+    
+    def _snapshot_payload(self) -> Dict[str, Any]:
+        """Copy the payload's containers so it can be encoded off the Tk thread"""
+        return {key: value.copy() for key, value in self._build_payload().items()}
+    
+    def _on_save_done(self, future, filename, version):
+        """Report the result of a background save, caching bytes encoded by the worker"""
+        try:
+            json_bytes = future.result()
+            if json_bytes is not None and version == self._version:
+                self._json_cache = (version, json_bytes)
+            messagebox.showinfo("Success", f"JSON file saved successfully to:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save file:\n{str(e)}")
     
     def load_from_file(self):
         """Load JSON from file"""
@@ -444,40 +627,46 @@ class JSONGeneratorApp:
         )
         
         if filename:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
-                
-                # Update internal data
-                if "catchment" in loaded_data:
-                    self.data["catchment"] = loaded_data["catchment"]
-                    self.catchment_name.delete(0, tk.END)
-                    self.catchment_name.insert(0, loaded_data["catchment"].get("name", ""))
-                    self.catchment_abbrev.delete(0, tk.END)
-                    self.catchment_abbrev.insert(0, loaded_data["catchment"].get("abbreviation", ""))
-                
-                for key in ["HRU", "landCoverType", "bucket", "grainSizeClass"]:
-                    if key in loaded_data:
-                        self.data[key] = loaded_data[key]
-                
-                messagebox.showinfo("Success", "JSON file loaded successfully!")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
+            self._run_io("Loading…", self._on_load_done, _read_json, filename)
+    
+    def _on_load_done(self, future):
+        """Apply the result of a background load to the form"""
+        try:
+            loaded_data = future.result()
+            
+            # Update internal data
+            if "catchment" in loaded_data:
+                self.data["catchment"] = loaded_data["catchment"]
+                for item_key, _, help_suffix, _, default in CATCHMENT_FIELDS:
+                    self._vars[f"catchment_{help_suffix}"].set(loaded_data["catchment"].get(item_key, default))
+            
+            for key in PAYLOAD_KEYS[1:]:
+                if key in loaded_data:
+                    self.data[key] = loaded_data[key]
+                    self._refresh_list(key)
+            self._mark_changed()
+            
+            messagebox.showinfo("Success", "JSON file loaded successfully!")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load file:\n{str(e)}")
     
     def clear_all(self):
         """Clear all data"""
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to clear all data?"):
-            self.data = {
-                "catchment": {"name": "", "abbreviation": ""},
-                "HRU": [],
-                "landCoverType": [],
-                "bucket": [],
-                "grainSizeClass": []
-            }
+            # Empty the existing containers in place rather than allocating new ones
+            catchment = self.data["catchment"]
+            catchment.clear()
+            catchment["name"] = catchment["abbreviation"] = ""
+            for key in PAYLOAD_KEYS[1:]:
+                self.data[key].clear()
             
-            self.catchment_name.delete(0, tk.END)
-            self.catchment_abbrev.delete(0, tk.END)
+            # Reset every entry through its variable; grain sizes go back to their defaults
+            for var_key, default in self._var_defaults.items():
+                self._vars[var_key].set(default)
+            for key in self._list_models:
+                self._refresh_list(key)
+            self._mark_changed()
             
             messagebox.showinfo("Cleared", "All data has been cleared.")
 
@@ -11,7 +11,8 @@ This script generates time series data for hydrological modeling by:
 6. Generating soil temperature time series for each bucket in each HRU/landcover combination
 7. Writing results to specified output locations
 
-Uses only Python standard library components plus existing project code.
+Uses only Python standard library components plus existing project code;
+numpy is used for vectorized calculations when it is installed.
 All output is written to a log file instead of console.
 """
 
@@ -20,12 +21,112 @@ import sys
 import json
 import csv
 import datetime
+import functools
+import itertools
 import math
+import re
 import uuid
-import tkinter as tk
-from tkinter import messagebox, filedialog
 import logging
 
+# Try to import tkinter for interactive file selection; batch runs work without it
+try:
+    import tkinter as tk
+    from tkinter import messagebox, filedialog
+    HAS_TKINTER = True
+except ImportError:
+    HAS_TKINTER = False
+
+# Try to import numpy for vectorized calculations
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Try to import numba to compile the PET and snowpack kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Try to import orjson for faster JSON metadata reads
+try:
+    import orjson
+    HAS_ORJSON = True
+    _loads = orjson.loads
+except ImportError:
+    HAS_ORJSON = False
+    _loads = json.loads
+
+
+def _json_default(obj):
+    """Serialize datetimes as ISO 8601 strings and numpy values as Python values."""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Metadata is always written in the json.dump(indent=4) format, which orjson
+# cannot produce; json.dump builds a new encoder per call, so reuse one instead
+_ENCODER = json.JSONEncoder(indent=4, default=_json_default)
+
+
+def _dumps(obj):
+    return _ENCODER.encode(obj).encode('utf-8')
+
+
+def read_json(path):
+    """Read and parse a JSON file in one binary read."""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+# Buffer size for reading and writing time series CSV files
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+
+def _discard(tmp_path):
+    """Remove a partially written temporary file, if it exists."""
+    try:
+        os.remove(tmp_path)
+    except OSError:
+        pass
+
+
+def write_json(path, obj):
+    """
+    Serialize obj and write it to path in one binary write.
+    
+    The data goes to a temporary file that replaces path once complete, so
+    an existing path never holds a partial file after an interrupted run.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(obj))
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
+def write_csv(path, header, rows):
+    """Write a header and rows to a CSV file, replacing path only once complete (see write_json)."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', buffering=_CSV_BUFFER_SIZE, newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        os.replace(tmp_path, path)
+    except BaseException:
+        _discard(tmp_path)
+        raise
+
+
 # Set up logging to file
 def setup_logging():
     """Set up logging to write all output to a log file."""
@@ -70,12 +171,487 @@ try:
     # Import project modules
     from calculate_solar_radiation import compute_radiation_timeseries
     from calculate_rain_and_snow import calculate_rain_and_snow_with_params, load_timeseries_from_files
-    from calculate_soil_temperature import calculate_soil_temperature_with_landcover_params
-    from timeSeries import TimeSeries
+    from calculate_soil_temperature import calculate_soil_temperature_with_landcover_params, SimplifiedTimeSeries
 except ImportError as e:
     logger.warning(f"Could not import project modules: {e}")
     logger.warning("Some functionality may be limited.")
 
+try:
+    from timeSeries import TimeSeries
+except ImportError:
+    # The soil temperature step falls back to SimplifiedTimeSeries
+    TimeSeries = None
+
+
+# Naive whole-second ISO 8601 timestamps, as written by the project's time series tools
+# (year 0000 is left to datetime, which rejects it)
+_PLAIN_TIMESTAMP = re.compile(r'(?!0000)\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+
+
+def parse_timestamp_column(timestamp_strs, midpoint_seconds=None):
+    """
+    Parse the timestamp column of a CSV file.
+    
+    Returns (keep, isoformats, hours). keep is None when every timestamp
+    parsed, otherwise the indices of those that did; isoformats are the
+    parsed timestamps written back with isoformat(). When midpoint_seconds is
+    given, hours holds the hour of day (to the minute) that long after each
+    timestamp, otherwise None.
+    
+    A column of plain naive whole-second timestamps is parsed with numpy in
+    one call; anything else is parsed row by row.
+    """
+    if HAS_NUMPY and timestamp_strs and all(map(_PLAIN_TIMESTAMP.fullmatch, timestamp_strs)):
+        try:
+            stamps = np.array(timestamp_strs, dtype='datetime64[s]')
+        except ValueError:
+            stamps = None
+        
+        if stamps is not None:
+            hours = None
+            if midpoint_seconds is not None:
+                midpoint = stamps + np.timedelta64(datetime.timedelta(seconds=midpoint_seconds))
+                minutes = (midpoint - midpoint.astype('datetime64[D]')).astype('timedelta64[m]').astype(np.int64)
+                hours = (minutes // 60 + (minutes % 60) / 60.0).tolist()
+            return None, stamps.astype(str).tolist(), hours
+    
+    keep = []
+    isoformats = []
+    hours = [] if midpoint_seconds is not None else None
+    for i, timestamp_str in enumerate(timestamp_strs):
+        try:
+            timestamp = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            continue
+        
+        keep.append(i)
+        isoformats.append(timestamp.isoformat())
+        if hours is not None:
+            midpoint_time = timestamp + datetime.timedelta(seconds=midpoint_seconds)
+            hours.append(midpoint_time.hour + midpoint_time.minute / 60.0)
+    
+    if len(keep) == len(timestamp_strs):
+        keep = None
+    return keep, isoformats, hours
+
+
+def select_columns(rows, text_indices, float_indices, blank_as_zero=()):
+    """
+    Return (text_columns, float_columns) taken from parsed CSV rows.
+    
+    Rows too short to hold every requested column, or holding a value that
+    float() rejects, are dropped; empty values in the blank_as_zero columns
+    count as 0.0. When every row is complete and valid, whole columns are
+    converted at once instead of row by row.
+    """
+    width = max(text_indices + float_indices) + 1
+    if rows and min(map(len, rows)) >= width:
+        columns = {i: [row[i] for row in rows] for i in text_indices + float_indices}
+        try:
+            float_columns = []
+            for i in float_indices:
+                column = columns[i]
+                if i in blank_as_zero and '' in column:
+                    column = [value or '0' for value in column]
+                float_columns.append(list(map(float, column)))
+            return [columns[i] for i in text_indices], float_columns
+        except ValueError:
+            pass
+    
+    text_columns = [[] for _ in text_indices]
+    float_columns = [[] for _ in float_indices]
+    for row in rows:
+        if len(row) >= width:
+            try:
+                values = [float(row[i]) if row[i] or i not in blank_as_zero else 0.0 for i in float_indices]
+            except ValueError:
+                continue
+            for column, i in zip(text_columns, text_indices):
+                column.append(row[i])
+            for column, value in zip(float_columns, values):
+                column.append(value)
+    return text_columns, float_columns
+
+
+def _parse_value(value):
+    """Convert a CSV value to float; empty values become None and non-numeric text is kept."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return value
+
+
+def timeseries_data_rows(rows, value_indices):
+    """
+    Convert parsed CSV rows into TimeSeries data rows.
+    
+    Each data row holds the timestamp as a datetime, the location text and
+    the values of the value_indices columns converted with _parse_value
+    (None when a row is too short). Empty rows and rows with an invalid
+    timestamp are dropped. Timestamps and values are converted a whole
+    column at a time when possible.
+    """
+    rows = [row for row in rows if row]
+    timestamp_strs = [row[0] for row in rows]
+    
+    try:
+        timestamps = list(map(datetime.datetime.fromisoformat, timestamp_strs))
+    except ValueError:
+        timestamps = []
+        for timestamp_str in timestamp_strs:
+            try:
+                timestamps.append(datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00')))
+            except ValueError:
+                timestamps.append(None)
+    
+    if rows and min(map(len, rows)) > max(value_indices, default=1):
+        value_columns = []
+        for i in value_indices:
+            column = [row[i] for row in rows]
+            try:
+                value_columns.append(list(map(float, column)))
+            except ValueError:
+                value_columns.append(list(map(_parse_value, column)))
+        data_rows = zip(timestamps, [row[1] for row in rows], *value_columns)
+    else:
+        data_rows = ((timestamp, row[1] if len(row) > 1 else None,
+                      *[_parse_value(row[i]) if len(row) > i else None for i in value_indices])
+                     for timestamp, row in zip(timestamps, rows))
+    return [list(row) for row in data_rows if row[0] is not None]
+
+
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+_DAY_MICROSECONDS = 86400 * 1000000
+
+
+def solar_radiation_series(adjusted_start, timestep_seconds, num_records, latitudes):
+    """
+    Return (timestamps, values) for the built-in solar radiation model.
+    
+    values holds one radiation series per latitude; the timestamps and the
+    sun's declination and hour angle are shared, so every latitude is
+    evaluated from a single pass over the records. Radiation is evaluated at
+    the midpoint of each timestep. With numpy and a whole-second timestep all
+    latitudes and records are computed in one broadcast; otherwise the
+    records are computed one at a time.
+    """
+    lat_rads = [math.radians(latitude) for latitude in latitudes]
+    sin_lats = [math.sin(lat_rad) for lat_rad in lat_rads]
+    cos_lats = [math.cos(lat_rad) for lat_rad in lat_rads]
+    
+    if HAS_NUMPY and isinstance(timestep_seconds, int):
+        return _solar_radiation_numpy(adjusted_start, timestep_seconds, num_records, sin_lats, cos_lats)
+    
+    timestamps = []
+    values = [[] for _ in latitudes]
+    lat_terms = list(zip(sin_lats, cos_lats, values))
+    
+    # Step through wall-clock time in integer microseconds since adjusted_start
+    # (midnight), rounding the timestep the same way datetime.timedelta does
+    step_us = datetime.timedelta(seconds=timestep_seconds) // _ONE_MICROSECOND
+    half_step_us = datetime.timedelta(seconds=timestep_seconds / 2) // _ONE_MICROSECOND
+    start_ordinal = adjusted_start.toordinal()
+    offset = adjusted_start.isoformat()[19:]  # '' for naive datetimes, e.g. '+00:00' otherwise
+    
+    # Dates and declinations only change once per day, so cache them by day
+    date_day = midpoint_day = None
+    
+    for i in range(num_records):
+        current_us = i * step_us
+        day, time_us = divmod(current_us, _DAY_MICROSECONDS)
+        if day != date_day:
+            date_day = day
+            date = datetime.date.fromordinal(start_ordinal + day)
+            date_prefix = date.isoformat() + 'T'
+        seconds, microseconds = divmod(time_us, 1000000)
+        minutes, seconds = divmod(seconds, 60)
+        if microseconds:
+            time_part = f"{minutes // 60:02d}:{minutes % 60:02d}:{seconds:02d}.{microseconds:06d}"
+        else:
+            time_part = f"{minutes // 60:02d}:{minutes % 60:02d}:{seconds:02d}"
+        timestamps.append(date_prefix + time_part + offset)
+        
+        # Calculate solar radiation at the midpoint of the timestep
+        # This represents average conditions during the time period
+        day, time_us = divmod(current_us + half_step_us, _DAY_MICROSECONDS)
+        if day != midpoint_day:
+            midpoint_day = day
+            if day != date_day:
+                date = datetime.date.fromordinal(start_ordinal + day)
+            day_of_year = date.timetuple().tm_yday
+            
+            # Solar declination
+            declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
+            dec_rad = math.radians(declination)
+            sin_dec = math.sin(dec_rad)
+            cos_dec = math.cos(dec_rad)
+        minutes = time_us // 60000000
+        hour = minutes // 60 + (minutes % 60) / 60.0
+        
+        # Hour angle
+        hour_angle = 15 * (hour - 12)
+        cos_hour = math.cos(math.radians(hour_angle))
+        
+        for sin_lat, cos_lat, lat_values in lat_terms:
+            # Sine of the solar elevation angle; the sun is up only when it is positive
+            sin_elevation = sin_lat * sin_dec + cos_lat * cos_dec * cos_hour
+            
+            # Solar radiation (simplified model)
+            if sin_elevation > 0:
+                elevation = math.asin(sin_elevation)
+                lat_values.append(1000 * math.sin(elevation))  # W/m²
+            else:
+                lat_values.append(0.0)
+    
+    return timestamps, values
+
+
+def _solar_radiation_numpy(adjusted_start, timestep_seconds, num_records, sin_lats, cos_lats):
+    """Vectorized solar_radiation_series for a whole-second timestep."""
+    # Work on wall-clock time; a fixed UTC offset is re-attached to the output strings
+    start = np.datetime64(adjusted_start.replace(tzinfo=None), 's')
+    current = start + np.arange(num_records, dtype=np.int64) * np.timedelta64(timestep_seconds, 's')
+    midpoint = current.astype('datetime64[us]') + np.timedelta64(timestep_seconds * 500000, 'us')
+    
+    # Day of year and hour (to the minute) of each midpoint
+    midpoint_day = midpoint.astype('datetime64[D]')
+    day_of_year = (midpoint_day - midpoint.astype('datetime64[Y]')).astype(np.int64) + 1
+    minutes = (midpoint - midpoint_day).astype('timedelta64[m]').astype(np.int64)
+    hour = minutes // 60 + (minutes % 60) / 60.0
+    
+    declination = 23.45 * np.sin(np.radians(360 * (284 + day_of_year) / 365))
+    hour_angle = 15 * (hour - 12)
+    
+    dec_rad = np.radians(declination)
+    hour_rad = np.radians(hour_angle)
+    
+    # Sine of the solar elevation angle; one row per latitude, one column per record
+    sin_elevation = (
+        np.array(sin_lats)[:, np.newaxis] * np.sin(dec_rad) +
+        np.array(cos_lats)[:, np.newaxis] * np.cos(dec_rad) * np.cos(hour_rad)
+    )
+    
+    # Only evaluate the elevation where the sun is up; night records stay 0
+    daylight = sin_elevation > 0
+    elevation = np.arcsin(sin_elevation[daylight])
+    solar_radiation = np.zeros(sin_elevation.shape)
+    solar_radiation[daylight] = np.where(elevation > 0, 1000 * np.sin(elevation), 0.0)
+    
+    timestamps = current.astype(str)
+    offset = adjusted_start.isoformat()[19:]  # '' for naive datetimes, e.g. '+00:00' otherwise
+    if offset:
+        timestamps = np.char.add(timestamps, offset)
+    return timestamps.tolist(), solar_radiation.tolist()
+
+
+def midpoint_solar_radiation(hours):
+    """
+    Return the simplified daylight solar radiation (MJ/m²/day) for each record.
+    
+    hours are the timestep midpoints as fractional hours of the day. The
+    result only depends on the timestamps, so it is shared by every
+    landcover of an HRU.
+    """
+    if HAS_NUMPY:
+        hours = np.asarray(hours, dtype=np.float64)
+        return np.where((hours >= 6) & (hours <= 18), 300 * np.sin(np.pi * (hours - 6) / 12), 0.0) * 0.0864
+    
+    solar_radiation = []
+    for hour in hours:
+        # Simplified solar radiation calculation at midpoint
+        if 6 <= hour <= 18:  # Daylight hours
+            solar_factor = math.sin(math.pi * (hour - 6) / 12)
+            rs = 300 * solar_factor  # Simplified calculation
+        else:
+            rs = 0.0
+        
+        # Convert to MJ/m²/day
+        solar_radiation.append(rs * 0.0864)
+    return solar_radiation
+
+
+def potential_evapotranspiration_series(solar_radiation, temperatures, solar_scaling, degree_offset):
+    """
+    Return potential evapotranspiration (mm/day) for each record.
+    
+    solar_radiation comes from midpoint_solar_radiation and temperatures are
+    the air temperatures; PET follows a modified Jensen-Haise equation.
+    """
+    if HAS_NUMBA:
+        pet = np.empty(len(solar_radiation))
+        _pet_kernel(np.asarray(solar_radiation, dtype=np.float64), np.asarray(temperatures, dtype=np.float64),
+                    float(solar_scaling), float(degree_offset), pet)
+        return pet.tolist()
+    
+    if HAS_NUMPY:
+        adjusted_temp = np.asarray(temperatures, dtype=np.float64) + degree_offset
+        pet = np.where(adjusted_temp <= 0.0, 0.0, solar_radiation * (1.0 / solar_scaling) * adjusted_temp)
+        return np.where(pet > 0.0, pet, 0.0).tolist()
+    
+    pet_values = []
+    for rs, temperature in zip(solar_radiation, temperatures):
+        # Calculate adjusted temperature
+        adjusted_temp = temperature + degree_offset
+        
+        # Calculate PET using modified Jensen-Haise equation
+        if adjusted_temp <= 0.0:
+            pet = 0.0
+        else:
+            pet = rs * (1.0 / solar_scaling) * adjusted_temp
+        
+        pet_values.append(max(0.0, pet))  # Ensure non-negative
+    return pet_values
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _pet_kernel(solar_radiation, temperatures, solar_scaling, degree_offset, pet_out):
+        """Compiled potential_evapotranspiration_series."""
+        for i in range(solar_radiation.size):
+            adjusted_temp = temperatures[i] + degree_offset
+            pet = solar_radiation[i] * (1.0 / solar_scaling) * adjusted_temp if adjusted_temp > 0.0 else 0.0
+            pet_out[i] = pet if pet > 0.0 else 0.0
+
+
+def snowpack_series(temperatures, precipitations, snow_offset, rain_multipliers, snow_multipliers,
+                    melt_temp, melt_rate, initial_depth):
+    """
+    Return (snowfall, rain, snowpack, snowmelt) depths for each record.
+    
+    Precipitation falls as rain above snow_offset and as snow otherwise, each
+    scaled by its (landcover, subcatchment) multiplier pair; the snowpack then
+    melts with a degree-day model above melt_temp.
+    """
+    rain_mult_lc, rain_mult_sc = rain_multipliers
+    snow_mult_lc, snow_mult_sc = snow_multipliers
+    
+    if HAS_NUMBA:
+        n = len(temperatures)
+        columns = np.empty((4, n))
+        _snowpack_kernel(np.asarray(temperatures, dtype=np.float64), np.asarray(precipitations, dtype=np.float64),
+                         float(snow_offset), float(rain_mult_lc), float(rain_mult_sc),
+                         float(snow_mult_lc), float(snow_mult_sc), float(melt_temp), float(melt_rate),
+                         float(initial_depth), columns)
+        return tuple(column.tolist() for column in columns)
+    
+    if HAS_NUMPY:
+        # Partition precipitation and compute potential melt for all records at once;
+        # only the snowpack recurrence is left to the loop
+        temperatures = np.asarray(temperatures, dtype=np.float64)
+        precipitations = np.asarray(precipitations, dtype=np.float64)
+        is_rain = temperatures > snow_offset
+        rain_depths = np.where(is_rain, rain_mult_lc * rain_mult_sc * precipitations, 0.0).tolist()
+        snowfall_depths = np.where(is_rain, 0.0, snow_mult_lc * snow_mult_sc * precipitations).tolist()
+        melting = (temperatures > melt_temp).tolist()
+        potential_melts = (melt_rate * (temperatures - melt_temp)).tolist()
+        
+        snowpack_depths = []
+        snowmelt_depths = []
+        snowpack_depth = initial_depth
+        for snowfall_depth, melts, potential_melt in zip(snowfall_depths, melting, potential_melts):
+            if melts:
+                actual_melt = min(potential_melt, snowpack_depth + snowfall_depth)
+            else:
+                actual_melt = 0.0
+            snowpack_depth = max(0.0, snowpack_depth + snowfall_depth - actual_melt)
+            snowpack_depths.append(snowpack_depth)
+            snowmelt_depths.append(actual_melt)
+        return snowfall_depths, rain_depths, snowpack_depths, snowmelt_depths
+    
+    snowfall_depths = []
+    rain_depths = []
+    snowpack_depths = []
+    snowmelt_depths = []
+    snowpack_depth = initial_depth  # Track snowpack depth
+    
+    for temperature, precipitation in zip(temperatures, precipitations):
+        # Determine if precipitation is rain or snow
+        if temperature > snow_offset:
+            # Rain
+            rain_depth = rain_mult_lc * rain_mult_sc * precipitation
+            snowfall_depth = 0.0
+        else:
+            # Snow
+            rain_depth = 0.0
+            snowfall_depth = snow_mult_lc * snow_mult_sc * precipitation
+        
+        # Calculate snowmelt using degree day model
+        if temperature > melt_temp:
+            # Potential melt
+            potential_melt = melt_rate * (temperature - melt_temp)
+            
+            # Actual melt is limited by available snow (previous snowpack + new snowfall)
+            available_snow = snowpack_depth + snowfall_depth
+            actual_melt = min(potential_melt, available_snow)
+        else:
+            actual_melt = 0.0
+        
+        # Update snowpack depth
+        snowpack_depth = snowpack_depth + snowfall_depth - actual_melt
+        snowpack_depth = max(0.0, snowpack_depth)  # Cannot be negative
+        
+        # Store the calculated values
+        snowfall_depths.append(snowfall_depth)
+        rain_depths.append(rain_depth)
+        snowpack_depths.append(snowpack_depth)
+        snowmelt_depths.append(actual_melt)
+    return snowfall_depths, rain_depths, snowpack_depths, snowmelt_depths
+
+
+
+# Records per snowpack_series call when streaming rain/snow output rows
+SNOWPACK_CHUNK_SIZE = 100000
+
+
+def rain_and_snow_rows(timestamps, locations, temperatures, precipitations, snow_offset,
+                       rain_multipliers, snow_multipliers, melt_temp, melt_rate, initial_depth,
+                       chunk_size=SNOWPACK_CHUNK_SIZE):
+    """
+    Yield rain/snow output rows (timestamp, location, air temperature, snowfall,
+    rain, snowpack, snowmelt), running snowpack_series over chunk_size records
+    at a time and carrying the snowpack depth between chunks, so only one
+    chunk of output columns is held in memory.
+    """
+    snowpack_depth = initial_depth
+    for start in range(0, len(temperatures), chunk_size):
+        stop = start + chunk_size
+        chunk_temperatures = temperatures[start:stop]
+        snowfall_depths, rain_depths, snowpack_depths, snowmelt_depths = snowpack_series(
+            chunk_temperatures, precipitations[start:stop], snow_offset, rain_multipliers,
+            snow_multipliers, melt_temp, melt_rate, snowpack_depth)
+        yield from zip(timestamps[start:stop], locations[start:stop], chunk_temperatures,
+                       snowfall_depths, rain_depths, snowpack_depths, snowmelt_depths)
+        snowpack_depth = snowpack_depths[-1]
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _snowpack_kernel(temperatures, precipitations, snow_offset, rain_mult_lc, rain_mult_sc,
+                         snow_mult_lc, snow_mult_sc, melt_temp, melt_rate, snowpack_depth, out):
+        """Compiled snowpack_series; out rows are snowfall, rain, snowpack and snowmelt."""
+        for i in range(temperatures.size):
+            temperature = temperatures[i]
+            if temperature > snow_offset:
+                rain_depth = rain_mult_lc * rain_mult_sc * precipitations[i]
+                snowfall_depth = 0.0
+            else:
+                rain_depth = 0.0
+                snowfall_depth = snow_mult_lc * snow_mult_sc * precipitations[i]
+            
+            actual_melt = 0.0
+            if temperature > melt_temp:
+                potential_melt = melt_rate * (temperature - melt_temp)
+                available_snow = snowpack_depth + snowfall_depth
+                actual_melt = available_snow if available_snow < potential_melt else potential_melt
+            
+            snowpack_depth = snowpack_depth + snowfall_depth - actual_melt
+            if not snowpack_depth > 0.0:
+                snowpack_depth = 0.0
+            
+            out[0, i] = snowfall_depth
+            out[1, i] = rain_depth
+            out[2, i] = snowpack_depth
+            out[3, i] = actual_melt
+
 
 class TimeSeriesValidator:
     """Class to validate time series data consistency."""
@@ -86,8 +662,7 @@ class TimeSeriesValidator:
     def load_timeseries_metadata(self, csv_file_path, json_file_path):
         """Load and parse time series metadata from JSON file."""
         try:
-            with open(json_file_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = read_json(json_file_path)
             
             # Extract key information
             start_datetime = metadata.get('start_datetime')
@@ -116,21 +691,49 @@ class TimeSeriesValidator:
     def validate_csv_structure(self, csv_file_path):
         """Validate the structure of a CSV file."""
         try:
-            with open(csv_file_path, 'r') as f:
+            with open(csv_file_path, 'r', newline='') as f:
                 reader = csv.reader(f)
                 headers = next(reader)  # First row should be headers
-                
-                # Count actual rows
-                row_count = 0
-                for row in reader:
-                    if row:  # Skip empty rows
-                        row_count += 1
-                
-                return {
-                    'valid': True,
-                    'headers': headers,
-                    'row_count': row_count
-                }
+            
+            # Count actual rows by counting line endings a block at a time; files
+            # with quoted fields, bare carriage returns or empty lines are parsed instead
+            needs_parsing = False
+            newline_count = 0
+            lone_cr_count = 0
+            tail = b'\n'  # End of the previous block; the file start counts as a line start
+            with open(csv_file_path, 'rb') as f:
+                for block in iter(functools.partial(f.read, _CSV_BUFFER_SIZE), b''):
+                    newline_count += block.count(b'\n')
+                    cr_count = block.count(b'\r')
+                    if cr_count:
+                        lone_cr_count += cr_count - block.count(b'\r\n')
+                    if tail.endswith(b'\r') and block.startswith(b'\n'):
+                        lone_cr_count -= 1  # A \r\n pair split across blocks
+                    window = tail + block[:2]
+                    if (b'"' in block or b'\n\n' in block or b'\n\n' in window
+                            or (cr_count and b'\n\r\n' in block) or b'\n\r\n' in window):
+                        needs_parsing = True
+                        break
+                    tail = (tail + block)[-2:]
+            
+            if needs_parsing or lone_cr_count:
+                with open(csv_file_path, 'r', buffering=_CSV_BUFFER_SIZE, newline='') as f:
+                    reader = csv.reader(f)
+                    next(reader)
+                    row_count = 0
+                    for row in reader:
+                        if row:  # Skip empty rows
+                            row_count += 1
+            else:
+                row_count = newline_count - 1
+                if not tail.endswith(b'\n'):
+                    row_count += 1
+            
+            return {
+                'valid': True,
+                'headers': headers,
+                'row_count': row_count
+            }
                 
         except Exception as e:
             return {
@@ -177,13 +780,24 @@ class HydrologicalTimeSeriesGenerator:
         self.base_folder = None
         self.validator = TimeSeriesValidator()
         self.hru_timeseries_info = []
+        self.landcover_timeseries = {}
+        self.catchment_hrus = {}
+        self.timeseries_hrus = {}
+        
+        # Parsed input CSVs shared by the PET and rain/snow steps, keyed by path
+        self._csv_cache = {}
         
-        # Initialize GUI support
+        # GUI support is only initialized when a dialog is needed (see _ensure_gui)
         self.root = None
-        self.setup_gui()
     
-    def setup_gui(self):
-        """Initialize tkinter for potential GUI operations."""
+    def _ensure_gui(self):
+        """Initialize tkinter on first use and return the root window, or None if unavailable."""
+        if self.root is not None:
+            return self.root
+        if not HAS_TKINTER:
+            logger.warning("GUI setup warning: tkinter is not installed")
+            return None
+        
         try:
             self.root = tk.Tk()
             self.root.withdraw()  # Hide the main window initially
@@ -204,12 +818,13 @@ class HydrologicalTimeSeriesGenerator:
                 
         except Exception as e:
             logger.warning(f"GUI setup warning: {e}")
+        
+        return self.root
     
     def load_json_file(self, file_path):
         """Load and parse a JSON file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return read_json(file_path)
         except FileNotFoundError:
             logger.error(f"File {file_path} not found.")
             return None
@@ -244,8 +859,42 @@ class HydrologicalTimeSeriesGenerator:
             logger.warning("No base folder specified in time series configuration")
             self.base_folder = os.path.dirname(self.timeseries_file)
         
+        # Index HRUs by name; the first HRU with a given name wins, as with a linear scan
+        self.catchment_hrus = {}
+        for hru in self.catchment_data.get('HRUs', []):
+            self.catchment_hrus.setdefault(hru.get('name'), hru)
+        
+        # Index time series configurations by HRU name and by (HRU name, landcover name)
+        self.timeseries_hrus = {}
+        self.landcover_timeseries = {}
+        for ts_hru in self.timeseries_data.get('catchment', {}).get('HRUs', []):
+            self.timeseries_hrus.setdefault(ts_hru.get('name'), ts_hru)
+            try:
+                landcover_types_ts = ts_hru['timeSeries']['subcatchment']['landCoverTypes']
+            except KeyError:
+                continue
+            for lc_ts in landcover_types_ts:
+                self.landcover_timeseries.setdefault((ts_hru.get('name'), lc_ts.get('name')), lc_ts)
+        
         return True
     
+    def read_timeseries_csv(self, csv_path):
+        """Return (headers, rows) of a CSV file, reading each file only once per run."""
+        cached = self._csv_cache.get(csv_path)
+        if cached is None:
+            with open(csv_path, 'r', buffering=_CSV_BUFFER_SIZE, newline='') as f:
+                reader = csv.reader(f)
+                headers = next(reader)
+                cached = self._csv_cache[csv_path] = (headers, list(reader))
+        return cached
+    
+    def landcover_timeseries_filename(self, hru_name, lc_name, series_name):
+        """Return the configured file name of a landcover time series, or None if not configured."""
+        try:
+            return self.landcover_timeseries[(hru_name, lc_name)]['timeSeries'][series_name]['fileName']
+        except KeyError:
+            return None
+    
     def validate_temperature_precipitation_files(self):
         """Validate that all HRUs have valid temperature/precipitation files."""
         logger.info("Validating temperature/precipitation files...")
@@ -259,11 +908,7 @@ class HydrologicalTimeSeriesGenerator:
             
             try:
                 # Find time series configuration for this HRU
-                hru_ts_config = None
-                for ts_hru in self.timeseries_data['catchment']['HRUs']:
-                    if ts_hru['name'] == hru_name:
-                        hru_ts_config = ts_hru
-                        break
+                hru_ts_config = self.timeseries_hrus.get(hru_name)
                 
                 if not hru_ts_config:
                     logger.error(f"No time series configuration found for {hru_name}")
@@ -297,11 +942,29 @@ class HydrologicalTimeSeriesGenerator:
                     logger.error(f"Invalid CSV structure for {hru_name}: {csv_info.get('error', 'Unknown error')}")
                     return False
                 
+                # Locate the temperature and precipitation columns once for all generators
+                temp_columns = []
+                precip_columns = []
+                for i, header in enumerate(csv_info['headers']):
+                    header = header.lower()
+                    if 'temperature' in header:
+                        temp_columns.append(i)
+                    elif 'precipitation' in header:
+                        precip_columns.append(i)
+                
+                if len(temp_columns) > 1 or len(precip_columns) > 1:
+                    logger.warning(f"Several temperature/precipitation columns in {csv_path}: "
+                                   f"PET uses the first temperature column, rain/snow the last "
+                                   f"temperature and precipitation columns")
+                
                 # Store information for consistency check
                 metadata_info['hru_name'] = hru_name
                 metadata_info['csv_path'] = csv_path
                 metadata_info['json_path'] = json_path
                 metadata_info['coordinates'] = hru.get('coordinates', {})
+                metadata_info['pet_temp_idx'] = temp_columns[0] if temp_columns else None
+                metadata_info['temp_idx'] = temp_columns[-1] if temp_columns else None
+                metadata_info['precip_idx'] = precip_columns[-1] if precip_columns else None
                 hru_timeseries_info.append(metadata_info)
                 
                 logger.info(f"  ✓ Valid - {metadata_info['num_records']} records, timestep: {metadata_info['timestep_seconds']}s")
@@ -324,474 +987,339 @@ class HydrologicalTimeSeriesGenerator:
         self.hru_timeseries_info = hru_timeseries_info
         return True
     
+    def _for_each_hru(self, generate_for_hru, *per_hru_args):
+        """
+        Run generate_for_hru for each validated HRU in turn, stopping at the first failure.
+        
+        generate_for_hru receives the HRU's info followed by its item of each
+        per_hru_args sequence and returns False if generation failed.
+        """
+        for hru_args in zip(self.hru_timeseries_info, *per_hru_args):
+            if not generate_for_hru(*hru_args):
+                return False
+        return True
+    
     def generate_solar_radiation_timeseries(self):
         """Generate solar radiation time series for all HRUs."""
         logger.info("Generating solar radiation time series...")
         
-        # Process each HRU
-        for hru_info in self.hru_timeseries_info:
-            hru_name = hru_info['hru_name']
-            coordinates = hru_info['coordinates']
+        if not self.hru_timeseries_info:
+            return True
+        
+        # Validation guarantees every HRU shares the start, timestep and record
+        # count, so all HRU latitudes are evaluated over one set of timestamps
+        reference = self.hru_timeseries_info[0]
+        try:
+            # Start from the beginning of the first day
+            adjusted_start = reference['start_datetime'].replace(hour=0, minute=0, second=0, microsecond=0)
             
-            logger.info(f"Processing HRU: {hru_name}")
+            latitudes = [hru_info['coordinates'].get('decimalLatitude', 45.0) for hru_info in self.hru_timeseries_info]
+            timestamps, values = solar_radiation_series(adjusted_start, reference['timestep_seconds'],
+                                                        reference['num_records'], latitudes)
+        except Exception as e:
+            logger.error(f"Error generating solar radiation: {e}")
+            return False
+        
+        write_for_hru = functools.partial(self._write_solar_radiation_for_hru, adjusted_start, timestamps)
+        return self._for_each_hru(write_for_hru, values)
+    
+    def _write_solar_radiation_for_hru(self, adjusted_start, timestamps, hru_info, values):
+        """Write the solar radiation time series of one HRU."""
+        hru_name = hru_info['hru_name']
+        coordinates = hru_info['coordinates']
+        timestep_seconds = hru_info['timestep_seconds']
+        num_records = hru_info['num_records']
+        
+        logger.info(f"Processing HRU: {hru_name}")
+        
+        try:
+            # Create output filename
+            output_filename = f"{hru_name}_solarRadiation"
+            
+            # Check if files already exist
+            csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
+            json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
+            
+            if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
+                logger.info(f"  ✓ Skipping (files exist): {output_filename}")
+                return True
+            
+            # Write CSV file
+            write_csv(csv_output_path, ['timestamp', 'location', 'solarRadiation'],
+                      zip(timestamps, itertools.repeat(hru_name), values))
+            
+            # Create metadata
+            metadata = {
+                'description': f'Solar radiation time series for {hru_name}',
+                'start_datetime': adjusted_start,
+                'timestep_seconds': timestep_seconds,
+                'num_records': num_records,
+                'coordinates': coordinates,
+                'units': 'W/m²',
+                'calculation_method': 'built-in simple model'
+            }
+            
+            # Write JSON file
+            write_json(json_output_path, metadata)
+            
+            logger.info(f"  ✓ Generated: {output_filename}")
+            
+        except Exception as e:
+            logger.error(f"Error generating solar radiation for {hru_name}: {e}")
+            return False
+        
+        return True
+    
+    def generate_potential_evapotranspiration_timeseries(self):
+        """Generate potential evapotranspiration time series for all HRU/landcover combinations."""
+        logger.info("Generating potential evapotranspiration time series...")
+        
+        return self._for_each_hru(self._generate_potential_evapotranspiration_for_hru)
+    
+    def _generate_potential_evapotranspiration_for_hru(self, hru_info):
+        """Generate potential evapotranspiration time series for each landcover of one HRU."""
+        hru_name = hru_info['hru_name']
+        logger.info(f"Processing HRU: {hru_name}")
+        
+        # Get temperature data path
+        csv_path = hru_info['csv_path']
+        
+        # Get landCoverTypes for this HRU from catchment data
+        hru_catchment_data = self.catchment_hrus.get(hru_name)
+        
+        if not hru_catchment_data:
+            logger.error(f"No catchment data found for {hru_name}")
+            return True
+        
+        landcover_types = hru_catchment_data.get('subcatchment', {}).get('landCoverTypes', [])
+        if not landcover_types:
+            logger.warning(f"No land cover types found for {hru_name}")
+            return True
+        
+        logger.info(f"  Found {len(landcover_types)} land cover types")
+        
+        # Load temperature data once; it is shared by every landCoverType
+        try:
+            _, rows = self.read_timeseries_csv(csv_path)
+            
+            temp_idx = hru_info['pet_temp_idx']
+            if temp_idx is None:
+                logger.error(f"No temperature column found in {csv_path}")
+                return True
+            
+            # Keep the rows with a valid temperature
+            (timestamp_strs,), (temperatures,) = select_columns(rows, (0,), (temp_idx,))
+            
+            # Parse timestamps, dropping rows that have an invalid one; solar radiation
+            # is evaluated at the midpoint of the timestep (like solar radiation generator)
+            keep, timestamps, hours = parse_timestamp_column(timestamp_strs, hru_info['timestep_seconds'] / 2)
+            if keep is not None:
+                temperatures = [temperatures[i] for i in keep]
+            solar_radiation = midpoint_solar_radiation(hours)
+            
+        except Exception as e:
+            logger.error(f"Error reading temperature data for {hru_name}: {e}")
+            return False
+        
+        # Calculate PET for each landCoverType
+        for lc_data in landcover_types:
+            lc_name = lc_data.get('name', 'Unknown')
+            lc_abbrev = lc_data.get('abbreviation', 'UK')
+            
+            logger.info(f"    Calculating PET for {lc_name} ({lc_abbrev})")
+            
+            # Get evaporation parameters
+            evap_params = lc_data.get('evaporation', {})
+            solar_scaling = evap_params.get('solarRadiationScalingFactor', 60.0)
+            degree_offset = evap_params.get('growingDegreeOffset', 0.0)
+            
+            logger.info(f"      Parameters: solarRadiationScalingFactor={solar_scaling}, growingDegreeOffset={degree_offset}")
             
             try:
-                # Extract parameters from the time series info
-                start_datetime = hru_info['start_datetime']
-                timestep_seconds = hru_info['timestep_seconds']
-                num_records = hru_info['num_records']
-                
-                # Calculate end datetime
-                total_seconds = num_records * timestep_seconds
-                end_datetime = start_datetime + datetime.timedelta(seconds=total_seconds)
+                pet_values = potential_evapotranspiration_series(solar_radiation, temperatures, solar_scaling, degree_offset)
                 
-                # Start from the beginning of the first day
-                adjusted_start = start_datetime.replace(hour=0, minute=0, second=0, microsecond=0)
+                # Find output filename from time series configuration
+                output_filename = self.landcover_timeseries_filename(hru_name, lc_name, 'potentialEvapotranspiration')
                 
-                # Generate solar radiation data
-                solar_data = []
-                current_datetime = adjusted_start
-                
-                for i in range(num_records):
-                    # Calculate solar radiation at the midpoint of the timestep
-                    # This represents average conditions during the time period
-                    midpoint_time = current_datetime + datetime.timedelta(seconds=timestep_seconds / 2)
-                    
-                    latitude = coordinates.get('decimalLatitude', 45.0)
-                    longitude = coordinates.get('decimalLongitude', 0.0)
-                    
-                    # Simple solar radiation calculation using midpoint time
-                    day_of_year = midpoint_time.timetuple().tm_yday
-                    hour = midpoint_time.hour + midpoint_time.minute / 60.0
-                    
-                    # Solar declination
-                    declination = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-                    
-                    # Hour angle
-                    hour_angle = 15 * (hour - 12)
-                    
-                    # Solar elevation angle
-                    lat_rad = math.radians(latitude)
-                    dec_rad = math.radians(declination)
-                    hour_rad = math.radians(hour_angle)
-                    
-                    elevation = math.asin(
-                        math.sin(lat_rad) * math.sin(dec_rad) +
-                        math.cos(lat_rad) * math.cos(dec_rad) * math.cos(hour_rad)
-                    )
-                    
-                    # Solar radiation (simplified model)
-                    if elevation > 0:
-                        solar_radiation = 1000 * math.sin(elevation)  # W/m²
-                    else:
-                        solar_radiation = 0.0
-                    
-                    solar_data.append([current_datetime.isoformat(), hru_name, solar_radiation])
-                    
-                    # Move to next timestep
-                    current_datetime += datetime.timedelta(seconds=timestep_seconds)
-                
-                # Create output filename
-                output_filename = f"{hru_name}_solarRadiation"
+                if not output_filename:
+                    output_filename = f"{hru_name}_{lc_name}_potentialEvapotranspiration"
                 
                 # Check if files already exist
                 csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
                 json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
                 
                 if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
-                    logger.info(f"  ✓ Skipping (files exist): {output_filename}")
+                    logger.info(f"      ✓ Skipping (files exist): {output_filename}")
                     continue
                 
                 # Write CSV file
-                with open(csv_output_path, 'w', newline='') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['timestamp', 'location', 'solarRadiation'])
-                    writer.writerows(solar_data)
+                write_csv(csv_output_path, ['timestamp', 'location', 'potentialEvapotranspiration'],
+                          zip(timestamps, itertools.repeat(hru_name), pet_values))
                 
                 # Create metadata
                 metadata = {
-                    'description': f'Solar radiation time series for {hru_name}',
-                    'start_datetime': adjusted_start.isoformat(),
-                    'timestep_seconds': timestep_seconds,
-                    'num_records': num_records,
-                    'coordinates': coordinates,
-                    'units': 'W/m²',
-                    'calculation_method': 'built-in simple model'
+                    'description': f'Potential evapotranspiration for {hru_name} - {lc_name}',
+                    'start_datetime': hru_info['start_datetime'],
+                    'timestep_seconds': hru_info['timestep_seconds'],
+                    'num_records': len(timestamps),
+                    'hru_name': hru_name,
+                    'land_cover_type': lc_name,
+                    'degree_offset': degree_offset,
+                    'solar_scaling': solar_scaling,
+                    'units': 'mm/day',
+                    'calculation_method': 'simple temperature-based'
                 }
                 
                 # Write JSON file
-                with open(json_output_path, 'w') as jsonfile:
-                    json.dump(metadata, jsonfile, indent=4)
+                write_json(json_output_path, metadata)
                 
-                logger.info(f"  ✓ Generated: {output_filename}")
+                logger.info(f"      ✓ Generated: {output_filename}")
                 
             except Exception as e:
-                logger.error(f"Error generating solar radiation for {hru_name}: {e}")
+                logger.error(f"Error generating PET for {hru_name}/{lc_name}: {e}")
                 return False
         
         return True
     
-    def generate_potential_evapotranspiration_timeseries(self):
-        """Generate potential evapotranspiration time series for all HRU/landcover combinations."""
-        logger.info("Generating potential evapotranspiration time series...")
-        
-        # Process each HRU
-        for hru_info in self.hru_timeseries_info:
-            hru_name = hru_info['hru_name']
-            logger.info(f"Processing HRU: {hru_name}")
-            
-            # Get temperature data path
-            csv_path = hru_info['csv_path']
-            
-            # Get landCoverTypes for this HRU from catchment data
-            hru_catchment_data = None
-            for catchment_hru in self.catchment_data['HRUs']:
-                if catchment_hru['name'] == hru_name:
-                    hru_catchment_data = catchment_hru
-                    break
-            
-            if not hru_catchment_data:
-                logger.error(f"No catchment data found for {hru_name}")
-                continue
-            
-            landcover_types = hru_catchment_data.get('subcatchment', {}).get('landCoverTypes', [])
-            if not landcover_types:
-                logger.warning(f"No land cover types found for {hru_name}")
-                continue
-            
-            logger.info(f"  Found {len(landcover_types)} land cover types")
-            
-            # Calculate PET for each landCoverType
-            for lc_data in landcover_types:
-                lc_name = lc_data.get('name', 'Unknown')
-                lc_abbrev = lc_data.get('abbreviation', 'UK')
-                
-                logger.info(f"    Calculating PET for {lc_name} ({lc_abbrev})")
-                
-                # Get evaporation parameters
-                evap_params = lc_data.get('evaporation', {})
-                solar_scaling = evap_params.get('solarRadiationScalingFactor', 60.0)
-                degree_offset = evap_params.get('growingDegreeOffset', 0.0)
-                
-                logger.info(f"      Parameters: solarRadiationScalingFactor={solar_scaling}, growingDegreeOffset={degree_offset}")
-                
-                try:
-                    # Load temperature data
-                    temp_data = []
-                    with open(csv_path, 'r') as f:
-                        reader = csv.reader(f)
-                        headers = next(reader)  # Skip header
-                        
-                        # Find temperature column index
-                        temp_idx = None
-                        for i, header in enumerate(headers):
-                            if 'temperature' in header.lower():
-                                temp_idx = i
-                                break
-                        
-                        if temp_idx is None:
-                            logger.error(f"No temperature column found in {csv_path}")
-                            continue
-                        
-                        # Process each row
-                        for row in reader:
-                            if len(row) > temp_idx:
-                                try:
-                                    timestamp_str = row[0]
-                                    location = row[1]
-                                    temperature = float(row[temp_idx])
-                                    
-                                    # Parse timestamp
-                                    timestamp = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                    
-                                    # Calculate solar radiation at midpoint of timestep (like solar radiation generator)
-                                    midpoint_time = timestamp + datetime.timedelta(seconds=hru_info['timestep_seconds'] / 2)
-                                    day_of_year = midpoint_time.timetuple().tm_yday
-                                    hour = midpoint_time.hour + midpoint_time.minute / 60.0
-                                    
-                                    # Simplified solar radiation calculation at midpoint
-                                    if 6 <= hour <= 18:  # Daylight hours
-                                        solar_factor = math.sin(math.pi * (hour - 6) / 12)
-                                        rs = 300 * solar_factor  # Simplified calculation
-                                    else:
-                                        rs = 0.0
-                                    
-                                    # Convert to MJ/m²/day
-                                    rs = rs * 0.0864
-                                    
-                                    # Calculate adjusted temperature
-                                    adjusted_temp = temperature + degree_offset
-                                    
-                                    # Calculate PET using modified Jensen-Haise equation
-                                    if adjusted_temp <= 0.0:
-                                        pet = 0.0
-                                    else:
-                                        pet = rs * (1.0 / solar_scaling) * adjusted_temp
-                                    
-                                    pet = max(0.0, pet)  # Ensure non-negative
-                                    temp_data.append([timestamp.isoformat(), hru_name, pet])
-                                except (ValueError, IndexError):
-                                    continue
-                    
-                    # Find output filename from time series configuration
-                    output_filename = None
-                    for ts_hru in self.timeseries_data['catchment']['HRUs']:
-                        if ts_hru['name'] == hru_name:
-                            try:
-                                landcover_types_ts = ts_hru['timeSeries']['subcatchment']['landCoverTypes']
-                                for lc_ts in landcover_types_ts:
-                                    if lc_ts['name'] == lc_name:
-                                        pet_info = lc_ts['timeSeries']['potentialEvapotranspiration']
-                                        output_filename = pet_info['fileName']
-                                        break
-                                if output_filename:
-                                    break
-                            except KeyError:
-                                pass
-                    
-                    if not output_filename:
-                        output_filename = f"{hru_name}_{lc_name}_potentialEvapotranspiration"
-                    
-                    # Check if files already exist
-                    csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
-                    json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
-                    
-                    if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
-                        logger.info(f"      ✓ Skipping (files exist): {output_filename}")
-                        continue
-                    
-                    # Write CSV file
-                    with open(csv_output_path, 'w', newline='') as csvfile:
-                        writer = csv.writer(csvfile)
-                        writer.writerow(['timestamp', 'location', 'potentialEvapotranspiration'])
-                        writer.writerows(temp_data)
-                    
-                    # Create metadata
-                    metadata = {
-                        'description': f'Potential evapotranspiration for {hru_name} - {lc_name}',
-                        'start_datetime': hru_info['start_datetime'].isoformat(),
-                        'timestep_seconds': hru_info['timestep_seconds'],
-                        'num_records': len(temp_data),
-                        'hru_name': hru_name,
-                        'land_cover_type': lc_name,
-                        'degree_offset': degree_offset,
-                        'solar_scaling': solar_scaling,
-                        'units': 'mm/day',
-                        'calculation_method': 'simple temperature-based'
-                    }
-                    
-                    # Write JSON file
-                    with open(json_output_path, 'w') as jsonfile:
-                        json.dump(metadata, jsonfile, indent=4)
-                    
-                    logger.info(f"      ✓ Generated: {output_filename}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating PET for {hru_name}/{lc_name}: {e}")
-                    return False
-        
-        return True
-    
     def generate_rain_and_snow_timeseries(self):
         """Generate rain and snow time series for all HRU/landcover combinations."""
         logger.info("Generating rain and snow time series...")
         
-        # Process each HRU
-        for hru_info in self.hru_timeseries_info:
-            hru_name = hru_info['hru_name']
-            logger.info(f"Processing HRU: {hru_name}")
+        return self._for_each_hru(self._generate_rain_and_snow_for_hru)
+    
+    def _generate_rain_and_snow_for_hru(self, hru_info):
+        """Generate rain and snow time series for each landcover of one HRU."""
+        hru_name = hru_info['hru_name']
+        logger.info(f"Processing HRU: {hru_name}")
+        
+        # Get temperature and precipitation data paths
+        csv_path = hru_info['csv_path']
+        
+        # Get landCoverTypes for this HRU from catchment data
+        hru_catchment_data = self.catchment_hrus.get(hru_name)
+        
+        if not hru_catchment_data:
+            logger.error(f"No catchment data found for {hru_name}")
+            return True
+        
+        # Get subcatchment parameters
+        subcatchment_data = hru_catchment_data.get('subcatchment', {})
+        precip_adjustments = subcatchment_data.get('precipitationAdjustments', {})
+        snow_offset = precip_adjustments.get('snowOffset', 0.0)
+        rain_mult_sc = precip_adjustments.get('rainfallMultiplier', 1.0)
+        snow_mult_sc = precip_adjustments.get('snowfallMultiplier', 1.0)
+        
+        landcover_types = subcatchment_data.get('landCoverTypes', [])
+        if not landcover_types:
+            logger.warning(f"No land cover types found for {hru_name}")
+            return True
+        
+        logger.info(f"  Found {len(landcover_types)} land cover types")
+        
+        # Load temperature and precipitation data once; it is shared by every landCoverType
+        try:
+            _, rows = self.read_timeseries_csv(csv_path)
             
-            # Get temperature and precipitation data paths
-            csv_path = hru_info['csv_path']
+            temp_idx = hru_info['temp_idx']
+            precip_idx = hru_info['precip_idx']
+            if temp_idx is None or precip_idx is None:
+                logger.error(f"Required columns not found in {csv_path}")
+                return True
             
-            # Get landCoverTypes for this HRU from catchment data
-            hru_catchment_data = None
-            for catchment_hru in self.catchment_data['HRUs']:
-                if catchment_hru['name'] == hru_name:
-                    hru_catchment_data = catchment_hru
-                    break
+            # Keep the rows with a valid temperature and precipitation (missing precipitation is 0)
+            (timestamp_strs, locations), (temperatures, precipitations) = select_columns(
+                rows, (0, 1), (temp_idx, precip_idx), blank_as_zero=(precip_idx,))
             
-            if not hru_catchment_data:
-                logger.error(f"No catchment data found for {hru_name}")
-                continue
+            # Parse timestamps, dropping rows that have an invalid one
+            keep, timestamps, _ = parse_timestamp_column(timestamp_strs)
+            if keep is not None:
+                locations = [locations[i] for i in keep]
+                temperatures = [temperatures[i] for i in keep]
+                precipitations = [precipitations[i] for i in keep]
             
-            # Get subcatchment parameters
-            subcatchment_data = hru_catchment_data.get('subcatchment', {})
-            precip_adjustments = subcatchment_data.get('precipitationAdjustments', {})
-            snow_offset = precip_adjustments.get('snowOffset', 0.0)
-            rain_mult_sc = precip_adjustments.get('rainfallMultiplier', 1.0)
-            snow_mult_sc = precip_adjustments.get('snowfallMultiplier', 1.0)
+        except Exception as e:
+            logger.error(f"Error reading temperature/precipitation data for {hru_name}: {e}")
+            return False
+        
+        # Calculate rain and snow for each landCoverType
+        for lc_data in landcover_types:
+            lc_name = lc_data.get('name', 'Unknown')
+            lc_abbrev = lc_data.get('abbreviation', 'UK')
             
-            landcover_types = subcatchment_data.get('landCoverTypes', [])
-            if not landcover_types:
-                logger.warning(f"No land cover types found for {hru_name}")
-                continue
+            logger.info(f"    Calculating rain/snow for {lc_name} ({lc_abbrev})")
             
-            logger.info(f"  Found {len(landcover_types)} land cover types")
+            # Get landcover parameters
+            rain_mult_lc = lc_data.get('rainfallMultiplier', 1.0)
+            snow_mult_lc = lc_data.get('snowfallMultiplier', 1.0)
+            snowpack_params = lc_data.get('snowpack', {})
+            melt_temp = snowpack_params.get('meltTemperature', 0.0)
+            melt_rate = snowpack_params.get('degreeDayMeltRate', 3.0)
+            initial_depth = snowpack_params.get('depth', 0.0)
             
-            # Calculate rain and snow for each landCoverType
-            for lc_data in landcover_types:
-                lc_name = lc_data.get('name', 'Unknown')
-                lc_abbrev = lc_data.get('abbreviation', 'UK')
+            logger.info(f"      Parameters: rain_mult={rain_mult_lc}, snow_mult={snow_mult_lc}, melt_temp={melt_temp}")
+            
+            try:
+                if len(timestamps) == 0:
+                    logger.warning(f"No rain/snow data generated for {hru_name}/{lc_name}")
+                    continue
                 
-                logger.info(f"    Calculating rain/snow for {lc_name} ({lc_abbrev})")
+                logger.info(f"      Generated {len(timestamps)} rain/snow records")
                 
-                # Get landcover parameters
-                rain_mult_lc = lc_data.get('rainfallMultiplier', 1.0)
-                snow_mult_lc = lc_data.get('snowfallMultiplier', 1.0)
-                snowpack_params = lc_data.get('snowpack', {})
-                melt_temp = snowpack_params.get('meltTemperature', 0.0)
-                melt_rate = snowpack_params.get('degreeDayMeltRate', 3.0)
-                initial_depth = snowpack_params.get('depth', 0.0)
+                # Find output filename from time series configuration
+                output_filename = self.landcover_timeseries_filename(hru_name, lc_name, 'rainAndSnow')
                 
-                logger.info(f"      Parameters: rain_mult={rain_mult_lc}, snow_mult={snow_mult_lc}, melt_temp={melt_temp}")
+                if not output_filename:
+                    output_filename = f"{hru_name}_{lc_name}_rainAndSnow"
                 
-                try:
-                    # Load temperature and precipitation data
-                    rain_snow_data = []
-                    snowpack_depth = initial_depth  # Track snowpack depth
-                    
-                    with open(csv_path, 'r') as f:
-                        reader = csv.reader(f)
-                        headers = next(reader)  # Skip header
-                        
-                        # Find column indices
-                        temp_idx = None
-                        precip_idx = None
-                        for i, header in enumerate(headers):
-                            if 'temperature' in header.lower():
-                                temp_idx = i
-                            elif 'precipitation' in header.lower():
-                                precip_idx = i
-                        
-                        if temp_idx is None or precip_idx is None:
-                            logger.error(f"Required columns not found in {csv_path}")
-                            continue
-                        
-                        # Process each row
-                        for row in reader:
-                            if len(row) > max(temp_idx, precip_idx):
-                                try:
-                                    timestamp_str = row[0]
-                                    location = row[1]
-                                    temperature = float(row[temp_idx])
-                                    precipitation = float(row[precip_idx]) if row[precip_idx] else 0.0
-                                    
-                                    # Parse timestamp
-                                    timestamp = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                    
-                                    # Determine if precipitation is rain or snow
-                                    if temperature > snow_offset:
-                                        # Rain
-                                        rain_depth = rain_mult_lc * rain_mult_sc * precipitation
-                                        snowfall_depth = 0.0
-                                    else:
-                                        # Snow
-                                        rain_depth = 0.0
-                                        snowfall_depth = snow_mult_lc * snow_mult_sc * precipitation
-                                    
-                                    # Calculate snowmelt using degree day model
-                                    if temperature > melt_temp:
-                                        # Potential melt
-                                        potential_melt = melt_rate * (temperature - melt_temp)
-                                        
-                                        # Actual melt is limited by available snow (previous snowpack + new snowfall)
-                                        available_snow = snowpack_depth + snowfall_depth
-                                        actual_melt = min(potential_melt, available_snow)
-                                    else:
-                                        actual_melt = 0.0
-                                    
-                                    # Update snowpack depth
-                                    snowpack_depth = snowpack_depth + snowfall_depth - actual_melt
-                                    snowpack_depth = max(0.0, snowpack_depth)  # Cannot be negative
-                                    
-                                    # Store the calculated values
-                                    rain_snow_data.append([
-                                        timestamp.isoformat(),
-                                        location,
-                                        temperature,      # air_temperature
-                                        snowfall_depth,   # snowfall_depth
-                                        rain_depth,       # rain_depth
-                                        snowpack_depth,   # snowpack_depth
-                                        actual_melt       # snowmelt_depth
-                                    ])
-                                except (ValueError, IndexError):
-                                    continue
-                    
-                    if len(rain_snow_data) == 0:
-                        logger.warning(f"No rain/snow data generated for {hru_name}/{lc_name}")
-                        continue
-                    
-                    logger.info(f"      Generated {len(rain_snow_data)} rain/snow records")
-                    
-                    # Find output filename from time series configuration
-                    output_filename = None
-                    for ts_hru in self.timeseries_data['catchment']['HRUs']:
-                        if ts_hru['name'] == hru_name:
-                            try:
-                                landcover_types_ts = ts_hru['timeSeries']['subcatchment']['landCoverTypes']
-                                for lc_ts in landcover_types_ts:
-                                    if lc_ts['name'] == lc_name:
-                                        rain_snow_info = lc_ts['timeSeries']['rainAndSnow']
-                                        output_filename = rain_snow_info['fileName']
-                                        break
-                                if output_filename:
-                                    break
-                            except KeyError:
-                                pass
-                    
-                    if not output_filename:
-                        output_filename = f"{hru_name}_{lc_name}_rainAndSnow"
-                    
-                    # Check if files already exist
-                    csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
-                    json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
-                    
-                    if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
-                        logger.info(f"      ✓ Skipping (files exist): {output_filename}")
-                        continue
-                    
-                    # Write CSV file
-                    with open(csv_output_path, 'w', newline='') as csvfile:
-                        writer = csv.writer(csvfile)
-                        writer.writerow(['timestamp', 'location', 'air_temperature', 'snowfall_depth', 'rain_depth', 'snowpack_depth', 'snowmelt_depth'])
-                        writer.writerows(rain_snow_data)
-                    
-                    # Create metadata
-                    metadata = {
-                        'description': f'Rain and snow dynamics for {hru_name} - {lc_name}',
-                        'start_datetime': hru_info['start_datetime'].isoformat(),
-                        'timestep_seconds': hru_info['timestep_seconds'],
-                        'num_records': len(rain_snow_data),
-                        'hru_name': hru_name,
-                        'land_cover_type': lc_name,
-                        'snow_offset': snow_offset,
-                        'rain_multiplier_sc': rain_mult_sc,
-                        'snow_multiplier_sc': snow_mult_sc,
-                        'rain_multiplier_lc': rain_mult_lc,
-                        'snow_multiplier_lc': snow_mult_lc,
-                        'melt_temperature': melt_temp,
-                        'degree_day_melt_rate': melt_rate,
-                        'initial_snowpack_depth': initial_depth,
-                        'units': {
-                            'air_temperature': 'degrees_C',
-                            'snowfall_depth': 'mm',
-                            'rain_depth': 'mm',
-                            'snowpack_depth': 'mm_SWE',
-                            'snowmelt_depth': 'mm'
-                        },
-                        'calculation_method': 'degree-day snowmelt model with scaling factors'
-                    }
-                    
-                    # Write JSON file
-                    with open(json_output_path, 'w') as jsonfile:
-                        json.dump(metadata, jsonfile, indent=4)
-                    
-                    logger.info(f"      ✓ Generated: {output_filename}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating rain/snow for {hru_name}/{lc_name}: {e}")
-                    return False
+                # Check if files already exist
+                csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
+                json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
+                
+                if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
+                    logger.info(f"      ✓ Skipping (files exist): {output_filename}")
+                    continue
+                
+                # Write CSV file, computing the snowpack a chunk of records at a time
+                write_csv(csv_output_path,
+                          ['timestamp', 'location', 'air_temperature', 'snowfall_depth', 'rain_depth', 'snowpack_depth', 'snowmelt_depth'],
+                          rain_and_snow_rows(timestamps, locations, temperatures, precipitations, snow_offset,
+                                             (rain_mult_lc, rain_mult_sc), (snow_mult_lc, snow_mult_sc),
+                                             melt_temp, melt_rate, initial_depth))
+                
+                # Create metadata
+                metadata = {
+                    'description': f'Rain and snow dynamics for {hru_name} - {lc_name}',
+                    'start_datetime': hru_info['start_datetime'],
+                    'timestep_seconds': hru_info['timestep_seconds'],
+                    'num_records': len(timestamps),
+                    'hru_name': hru_name,
+                    'land_cover_type': lc_name,
+                    'snow_offset': snow_offset,
+                    'rain_multiplier_sc': rain_mult_sc,
+                    'snow_multiplier_sc': snow_mult_sc,
+                    'rain_multiplier_lc': rain_mult_lc,
+                    'snow_multiplier_lc': snow_mult_lc,
+                    'melt_temperature': melt_temp,
+                    'degree_day_melt_rate': melt_rate,
+                    'initial_snowpack_depth': initial_depth,
+                    'units': {
+                        'air_temperature': 'degrees_C',
+                        'snowfall_depth': 'mm',
+                        'rain_depth': 'mm',
+                        'snowpack_depth': 'mm_SWE',
+                        'snowmelt_depth': 'mm'
+                    },
+                    'calculation_method': 'degree-day snowmelt model with scaling factors'
+                }
+                
+                # Write JSON file
+                write_json(json_output_path, metadata)
+                
+                logger.info(f"      ✓ Generated: {output_filename}")
+                
+            except Exception as e:
+                logger.error(f"Error generating rain/snow for {hru_name}/{lc_name}: {e}")
+                return False
         
         return True
     
@@ -805,11 +1333,7 @@ class HydrologicalTimeSeriesGenerator:
             logger.info(f"Processing HRU: {hru_name}")
             
             # Get landCoverTypes for this HRU from catchment data
-            hru_catchment_data = None
-            for catchment_hru in self.catchment_data['HRUs']:
-                if catchment_hru['name'] == hru_name:
-                    hru_catchment_data = catchment_hru
-                    break
+            hru_catchment_data = self.catchment_hrus.get(hru_name)
             
             if not hru_catchment_data:
                 logger.error(f"No catchment data found for {hru_name}")
@@ -830,202 +1354,163 @@ class HydrologicalTimeSeriesGenerator:
                 logger.info(f"    Processing soil temperature for {lc_name} ({lc_abbrev})")
                 
                 # Find the corresponding rain and snow file to use as input
-                rain_snow_filename = None
-                for ts_hru in self.timeseries_data['catchment']['HRUs']:
-                    if ts_hru['name'] == hru_name:
-                        try:
-                            landcover_types_ts = ts_hru['timeSeries']['subcatchment']['landCoverTypes']
-                            for lc_ts in landcover_types_ts:
-                                if lc_ts['name'] == lc_name:
-                                    rain_snow_info = lc_ts['timeSeries']['rainAndSnow']
-                                    rain_snow_filename = rain_snow_info['fileName']
-                                    break
-                            if rain_snow_filename:
-                                break
-                        except KeyError:
-                            pass
+                rain_snow_filename = self.landcover_timeseries_filename(hru_name, lc_name, 'rainAndSnow')
                 
                 if not rain_snow_filename:
                     rain_snow_filename = f"{hru_name}_{lc_name}_rainAndSnow"
                     logger.warning(f"Rain/snow filename not found, using default: {rain_snow_filename}")
                 
-                # Load the rain and snow time series (contains air temperature and snow depth)
-                try:
-                    rain_snow_csv = os.path.join(self.base_folder, f"{rain_snow_filename}.csv")
-                    rain_snow_json = os.path.join(self.base_folder, f"{rain_snow_filename}.json")
-                    
-                    if not os.path.exists(rain_snow_csv) or not os.path.exists(rain_snow_json):
-                        logger.error(f"Rain/snow files not found: {rain_snow_filename}")
-                        continue
-                    
-                    # Load the rain and snow time series using local function
-                    rain_snow_csv = os.path.join(self.base_folder, f"{rain_snow_filename}.csv")
-                    rain_snow_json = os.path.join(self.base_folder, f"{rain_snow_filename}.json")
-                    
-                    if not os.path.exists(rain_snow_csv) or not os.path.exists(rain_snow_json):
-                        logger.error(f"Rain/snow files not found: {rain_snow_filename}")
-                        continue
-                    
-                    # Load metadata from JSON
-                    try:
-                        with open(rain_snow_json, 'r') as f:
-                            metadata = json.load(f)
-                    except Exception as e:
-                        logger.error(f"Error loading JSON metadata: {e}")
-                        continue
-                    
-                    # Load data from CSV
-                    data = []
-                    columns = []
-                    
-                    try:
-                        with open(rain_snow_csv, 'r') as f:
-                            reader = csv.reader(f)
-                            columns = next(reader)  # First row is header
-                            
-                            for row in reader:
-                                if not row:  # Skip empty rows
-                                    continue
-                                
-                                try:
-                                    # Convert timestamp to datetime object
-                                    timestamp_str = row[0]
-                                    timestamp = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                                    
-                                    # Convert numeric values
-                                    processed_row = [timestamp]
-                                    for i, value in enumerate(row[1:], 1):
-                                        if i == 1:  # Location column
-                                            processed_row.append(value)
-                                        else:
-                                            try:
-                                                processed_row.append(float(value) if value else None)
-                                            except ValueError:
-                                                processed_row.append(value)
-                                    
-                                    data.append(processed_row)
-                                
-                                except Exception:
-                                    continue  # Skip problematic rows
-                    
-                    except Exception as e:
-                        logger.error(f"Error reading CSV file: {e}")
-                        continue
-                    
-                    # Create TimeSeries object
-                    TSClass = TimeSeries if TimeSeries is not None else SimplifiedTimeSeries
-                    input_ts = TSClass()
-                    input_ts.columns = columns
-                    input_ts.data = data
-                    input_ts.metadata = metadata
-                    
-                    # Get timestep from metadata
-                    timestep_seconds = hru_info['timestep_seconds']
-                    
-                    # Calculate soil temperature for all buckets in this landcover
-                    bucket_results = calculate_soil_temperature_with_landcover_params(
-                        input_timeseries=input_ts,
-                        landcover_params=lc_data,
-                        timestep_seconds=timestep_seconds,
-                        temp_column="air_temperature",
-                        snow_column="snowpack_depth"
-                    )
-                    
-                    logger.info(f"      Generated soil temperature for {len(bucket_results)} buckets")
-                    
-                    # Save results for each bucket
-                    for bucket_name, soil_ts in bucket_results.items():
-                        bucket_abbrev = ""
-                        
-                        # Find bucket abbreviation
-                        for bucket in lc_data.get('buckets', []):
-                            if bucket.get('name') == bucket_name:
-                                bucket_abbrev = bucket.get('abbreviation', '')
-                                break
-                        
-                        # Create output filename
-                        safe_hru = hru_name.replace(" ", "_")
-                        safe_lc = lc_name.replace(" ", "_")
-                        safe_bucket = bucket_name.replace(" ", "_")
-                        output_filename = f"{safe_hru}_{safe_lc}_{safe_bucket}_soilTemperature"
-                        
-                        # Check if files already exist
-                        csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
-                        json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
-                        
-                        if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
-                            logger.info(f"        ✓ Skipping (files exist): {output_filename}")
-                            continue
-                        
-                        # Extract soil temperature data for CSV
-                        soil_temp_data = []
-                        
-                        # Find the soil temperature column index
-                        soil_temp_idx = None
-                        for i, col in enumerate(soil_ts.columns):
-                            if 'soil_temperature' in str(col).lower():
-                                soil_temp_idx = i
-                                break
-                        
-                        if soil_temp_idx is None:
-                            logger.error(f"        Could not find soil temperature column in {soil_ts.columns}")
-                            continue
-                        
-                        for row in soil_ts.data:
-                            if len(row) > soil_temp_idx:
-                                timestamp = row[0]
-                                location = row[1] if len(row) > 1 else "Unknown"
-                                soil_temp = row[soil_temp_idx] if row[soil_temp_idx] is not None else None
-                                
-                                if soil_temp is not None:
-                                    soil_temp_data.append([
-                                        timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp),
-                                        location,
-                                        soil_temp
-                                    ])
-                        
-                        if len(soil_temp_data) == 0:
-                            logger.warning(f"No soil temperature data generated for {bucket_name}")
-                            continue
-                        
-                        # Write CSV file
-                        with open(csv_output_path, 'w', newline='') as csvfile:
-                            writer = csv.writer(csvfile)
-                            writer.writerow(['timestamp', 'location', 'soil_temperature_c'])
-                            writer.writerows(soil_temp_data)
-                        
-                        # Create metadata
-                        metadata = {
-                            'description': f'Soil temperature for {hru_name} - {lc_name} - {bucket_name}',
-                            'start_datetime': hru_info['start_datetime'].isoformat(),
-                            'timestep_seconds': hru_info['timestep_seconds'],
-                            'num_records': len(soil_temp_data),
-                            'hru_name': hru_name,
-                            'land_cover_type': lc_name,
-                            'bucket_name': bucket_name,
-                            'bucket_abbreviation': bucket_abbrev,
-                            'thermal_conductivity': soil_ts.metadata.get('thermal_conductivity', 'unknown'),
-                            'specific_heat_capacity': soil_ts.metadata.get('specific_heat_capacity', 'unknown'),
-                            'snow_depth_factor': soil_ts.metadata.get('snow_depth_factor', 'unknown'),
-                            'effective_depth': soil_ts.metadata.get('effective_depth', 'unknown'),
-                            'initial_temperature': soil_ts.metadata.get('initial_temperature', 'unknown'),
-                            'receives_precipitation': soil_ts.metadata.get('receives_precipitation', 'unknown'),
-                            'units': 'degrees_C',
-                            'calculation_method': 'thermal conductivity model with snow insulation'
-                        }
-                        
-                        # Write JSON file
-                        with open(json_output_path, 'w') as jsonfile:
-                            json.dump(metadata, jsonfile, indent=4)
-                        
-                        logger.info(f"        ✓ Generated: {output_filename}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating soil temperature for {hru_name}/{lc_name}: {e}")
+                if not self._generate_soil_temperature_for_landcover(hru_info, lc_data, rain_snow_filename):
                     return False
         
         return True
     
+    def _generate_soil_temperature_for_landcover(self, hru_info, lc_data, rain_snow_filename):
+        """Generate the soil temperature time series of every bucket in one HRU/landcover; return False on failure."""
+        hru_name = hru_info['hru_name']
+        lc_name = lc_data.get('name', 'Unknown')
+        
+        # Load the rain and snow time series (contains air temperature and snow depth)
+        try:
+            rain_snow_csv = os.path.join(self.base_folder, f"{rain_snow_filename}.csv")
+            rain_snow_json = os.path.join(self.base_folder, f"{rain_snow_filename}.json")
+            
+            if not os.path.exists(rain_snow_csv) or not os.path.exists(rain_snow_json):
+                logger.error(f"Rain/snow files not found: {rain_snow_filename}")
+                return True
+            
+            # Load metadata from JSON
+            try:
+                metadata = read_json(rain_snow_json)
+            except Exception as e:
+                logger.error(f"Error loading JSON metadata: {e}")
+                return True
+            
+            # Load data from CSV
+            try:
+                with open(rain_snow_csv, 'r', buffering=_CSV_BUFFER_SIZE, newline='') as f:
+                    reader = csv.reader(f)
+                    headers = next(reader)  # First row is header
+                    
+                    # Only the air temperature and snow depth drive the soil temperature model
+                    value_indices = [i for i, name in enumerate(headers)
+                                     if i >= 2 and name in ('air_temperature', 'snowpack_depth')]
+                    columns = headers[:2] + [headers[i] for i in value_indices]
+                    data = timeseries_data_rows(reader, value_indices)
+            
+            except Exception as e:
+                logger.error(f"Error reading CSV file: {e}")
+                return True
+            
+            # Create TimeSeries object
+            TSClass = TimeSeries if TimeSeries is not None else SimplifiedTimeSeries
+            input_ts = TSClass()
+            input_ts.columns = columns
+            input_ts.data = data
+            input_ts.metadata = metadata
+            
+            # Calculate soil temperature for all buckets in this landcover
+            bucket_results = calculate_soil_temperature_with_landcover_params(
+                input_timeseries=input_ts,
+                landcover_params=lc_data,
+                timestep_seconds=hru_info['timestep_seconds'],
+                temp_column="air_temperature",
+                snow_column="snowpack_depth"
+            )
+            
+            logger.info(f"      Generated soil temperature for {len(bucket_results)} buckets")
+            
+            # Every bucket series shares the input timestamps, so format them once
+            input_timestamps = [row[0] for row in data]
+            input_timestamp_strs = [timestamp.isoformat() for timestamp in input_timestamps]
+            
+            # Bucket abbreviations by name (the first bucket with a name wins)
+            bucket_abbreviations = {}
+            for bucket in lc_data.get('buckets', []):
+                bucket_abbreviations.setdefault(bucket.get('name'), bucket.get('abbreviation', ''))
+            
+            # Save results for each bucket
+            for bucket_name, soil_ts in bucket_results.items():
+                bucket_abbrev = bucket_abbreviations.get(bucket_name, "")
+                
+                # Create output filename
+                safe_hru = hru_name.replace(" ", "_")
+                safe_lc = lc_name.replace(" ", "_")
+                safe_bucket = bucket_name.replace(" ", "_")
+                output_filename = f"{safe_hru}_{safe_lc}_{safe_bucket}_soilTemperature"
+                
+                # Check if files already exist
+                csv_output_path = os.path.join(self.base_folder, f"{output_filename}.csv")
+                json_output_path = os.path.join(self.base_folder, f"{output_filename}.json")
+                
+                if not self.replace_all and os.path.exists(csv_output_path) and os.path.exists(json_output_path):
+                    logger.info(f"        ✓ Skipping (files exist): {output_filename}")
+                    continue
+                
+                # Extract soil temperature data for CSV
+                # Find the soil temperature column index
+                soil_temp_idx = None
+                for i, col in enumerate(soil_ts.columns):
+                    if 'soil_temperature' in str(col).lower():
+                        soil_temp_idx = i
+                        break
+                
+                if soil_temp_idx is None:
+                    logger.error(f"        Could not find soil temperature column in {soil_ts.columns}")
+                    continue
+                
+                soil_rows = soil_ts.data
+                timestamps = [row[0] for row in soil_rows]
+                if timestamps == input_timestamps:
+                    timestamp_strs = input_timestamp_strs
+                else:
+                    timestamp_strs = [timestamp.isoformat() if hasattr(timestamp, 'isoformat') else str(timestamp)
+                                      for timestamp in timestamps]
+                
+                soil_temp_data = [
+                    (timestamp_str, row[1] if len(row) > 1 else "Unknown", row[soil_temp_idx])
+                    for timestamp_str, row in zip(timestamp_strs, soil_rows)
+                    if len(row) > soil_temp_idx and row[soil_temp_idx] is not None
+                ]
+                
+                if len(soil_temp_data) == 0:
+                    logger.warning(f"No soil temperature data generated for {bucket_name}")
+                    continue
+                
+                # Write CSV file
+                write_csv(csv_output_path, ['timestamp', 'location', 'soil_temperature_c'], soil_temp_data)
+                
+                # Create metadata
+                metadata = {
+                    'description': f'Soil temperature for {hru_name} - {lc_name} - {bucket_name}',
+                    'start_datetime': hru_info['start_datetime'],
+                    'timestep_seconds': hru_info['timestep_seconds'],
+                    'num_records': len(soil_temp_data),
+                    'hru_name': hru_name,
+                    'land_cover_type': lc_name,
+                    'bucket_name': bucket_name,
+                    'bucket_abbreviation': bucket_abbrev,
+                    'thermal_conductivity': soil_ts.metadata.get('thermal_conductivity', 'unknown'),
+                    'specific_heat_capacity': soil_ts.metadata.get('specific_heat_capacity', 'unknown'),
+                    'snow_depth_factor': soil_ts.metadata.get('snow_depth_factor', 'unknown'),
+                    'effective_depth': soil_ts.metadata.get('effective_depth', 'unknown'),
+                    'initial_temperature': soil_ts.metadata.get('initial_temperature', 'unknown'),
+                    'receives_precipitation': soil_ts.metadata.get('receives_precipitation', 'unknown'),
+                    'units': 'degrees_C',
+                    'calculation_method': 'thermal conductivity model with snow insulation'
+                }
+                
+                # Write JSON file
+                write_json(json_output_path, metadata)
+                
+                logger.info(f"        ✓ Generated: {output_filename}")
+            
+        except Exception as e:
+            logger.error(f"Error generating soil temperature for {hru_name}/{lc_name}: {e}")
+            return False
+        
+        return True
+    
     def run_generation(self):
         """Run the complete time series generation process."""
         logger.info("=" * 60)
@@ -1059,6 +1544,9 @@ class HydrologicalTimeSeriesGenerator:
             logger.error("Generation failed: Rain and snow generation failed")
             return False
         
+        # The temperature/precipitation inputs are not needed after this point
+        self._csv_cache.clear()
+        
         # Step 6: Generate soil temperature time series
         if not self.generate_soil_temperature_timeseries():
             logger.error("Generation failed: Soil temperature generation failed")
@@ -1081,7 +1569,7 @@ class HydrologicalTimeSeriesGenerator:
     
     def interactive_file_selection(self):
         """Allow user to interactively select input files."""
-        if not self.root:
+        if not self._ensure_gui():
             logger.error("GUI not available for file selection")
             return False
         
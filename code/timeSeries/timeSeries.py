@@ -100,6 +100,35 @@ class TimeSeries:
         # Append the new row to the data
         self.data.append(new_row)
     
+    def extend_column(self, column_name, timestamps, locations, values):
+        """
+        Add one row per value, setting only the given column.
+        
+        This is the bulk equivalent of calling add_data(timestamp, location,
+        {column_name: value}) for each value in turn.
+        
+        Parameters:
+        column_name (str): The column to fill
+        timestamps (list): The timestamps for the new rows
+        locations (list): The location identifiers for the new rows
+        values (list): The values for the column
+        """
+        self.add_column(column_name)
+        col_index = self.columns.index(column_name)
+        n_columns = len(self.columns)
+        
+        new_rows = []
+        for timestamp, location, value in zip(timestamps, locations, values):
+            if not isinstance(timestamp, datetime.datetime):
+                raise TypeError("timestamp must be a datetime object")
+            new_row = [None] * n_columns
+            new_row[0] = timestamp
+            new_row[1] = location
+            new_row[col_index] = value
+            new_rows.append(new_row)
+        
+        self.data.extend(new_rows)
+    
     def add_metadata(self, key, value):
         """
         Add a metadata key-value pair.